@@ -7,11 +7,12 @@ import numpy as np
 import pandas as pd
 
 from scripts.assets import Battery
-from scripts.forecast import FeatureEngineer
+from scripts.forecast import FeatureEngineer, warm_up_kernels
 from scripts.market_simulator import EnergyMarketSimulator, PnLCalculator
 from scripts.optimizer import (
     BatteryOptimizationScheduler,
     GLPKOptimizationSolver,
+    HighsOptimizationSolver,
     PyomoModelExtractor,
     PyomoOptimizationModelBuilder,
 )
@@ -40,6 +41,7 @@ def create_price_model(args):
     elif args.price_model == "ForecastedPriceModel":
         data_provider = CSVDataProvider(args.csv_path)
         feature_engineer = FeatureEngineer()
+        warm_up_kernels()
         pretrained_model = ForecastPriceModel.load_model(args.price_forecast_model)
         return ForecastPriceModel(
             data_provider=data_provider,
@@ -58,7 +60,11 @@ def create_battery(args):
 
 def create_scheduler(battery, args):
     model_builder = PyomoOptimizationModelBuilder()
-    solver = GLPKOptimizationSolver(args.log_level)
+    solver = (
+        HighsOptimizationSolver(args.log_level, params_only=True)
+        if HighsOptimizationSolver.available()
+        else GLPKOptimizationSolver(args.log_level)
+    )
     model_extractor = PyomoModelExtractor()
     return BatteryOptimizationScheduler(
         battery=battery,
@@ -103,6 +109,7 @@ def run_simulation(
         default=os.path.join("models", "prices", "price_forecast_model.pkl"),
     )
     parser.add_argument("--log_level", type=str, default="INFO")
+    parser.add_argument("--n_jobs", type=int, default=1)
 
     if args is None:
         args = parser.parse_args()
@@ -131,10 +138,11 @@ def run_simulation(
             pnl_calculator=pnl_calculator,
             scheduler=scheduler,
             log_level=log_level,
+            n_jobs=args.n_jobs,
         )
         # Run the simulation
         results = simulator.simulate()
-        logger.debug(f"Simulation results with SimulatedPriceModel: \n{results}")
+        logger.debug("Simulation results with SimulatedPriceModel: \n%s", results)
         return results
 
     except Exception as e:
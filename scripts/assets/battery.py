@@ -192,6 +192,28 @@ class Battery:
         self.soc = max(self.soc - actual_energy_mwh / self.capacity_mwh, 0.0)
         self.update_soh_and_cycles(energy_mwh)
 
+    def apply_schedule(self, charge_mwh, discharge_mwh):
+        """
+        Applies a sequence of charge and discharge actions to the battery.
+
+        Each timestep charges if its charge is positive, otherwise discharges if its
+        discharge is positive, and idles (a zero charge) if both are zero. SOC
+        clipping, efficiency adjustment and SOH degradation all depend on the state
+        left by the previous step, so the steps are applied in order rather than
+        summed in one go.
+
+        Args:
+            charge_mwh (Iterable[float]): The energy to charge at each timestep in megawatt-hours.
+            discharge_mwh (Iterable[float]): The energy to discharge at each timestep in megawatt-hours.
+        """
+        for charge_value, discharge_value in zip(charge_mwh, discharge_mwh):
+            if charge_value > 0:
+                self.charge(charge_value)
+            elif discharge_value > 0:
+                self.discharge(discharge_value)
+            elif charge_value == 0.0 and discharge_value == 0.0:
+                self.charge(charge_value)
+
     def update_soh_and_cycles(self, energy_mwh: float):
         """
         Updates the state of health (SOH) and cycle count of the battery based on the energy cycled.
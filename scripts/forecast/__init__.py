@@ -1,2 +1,3 @@
 from .interfaces import *  # noqa: F403
+from .kernels import *  # noqa: F403
 from .ts_forecast import *  # noqa: F403
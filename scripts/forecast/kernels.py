@@ -0,0 +1,285 @@
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def rolling_quantile_block(values, window, quantiles):
+    """
+    Computes several rolling quantiles of a 1-D array in a single pass.
+
+    The window is kept as a sorted buffer: each step removes the value leaving
+    the window and inserts the one entering it, so every quantile is read
+    straight from its rank instead of partitioning a copy of every window.
+    Values are linearly interpolated between the closest ranks, matching
+    pandas' default `rolling().quantile(..., interpolation="linear")` and
+    `rolling().median()`.
+
+    Args:
+        values (numpy.ndarray): The input series as a float64 array.
+        window (int): The size of the rolling window.
+        quantiles (numpy.ndarray): The quantiles to compute, each between 0 and 1.
+
+    Returns:
+        numpy.ndarray: An array of shape (len(values), len(quantiles)). Windows that
+        are incomplete or contain NaN are set to NaN.
+    """
+    n = values.shape[0]
+    m = quantiles.shape[0]
+    out = np.full((n, m), np.nan)
+    if window < 1 or n < window:
+        return out
+
+    ranks = np.empty(m, dtype=np.int64)
+    fracs = np.empty(m)
+    for j in range(m):
+        pos = quantiles[j] * (window - 1)
+        ranks[j] = int(pos)
+        fracs[j] = pos - ranks[j]
+
+    # Only the values that are not NaN are buffered; a window with any NaN has
+    # fewer than `window` of them and is skipped
+    buffer = np.empty(window)
+    size = 0
+    for i in range(n):
+        if i >= window:
+            old = values[i - window]
+            if not np.isnan(old):
+                k = np.searchsorted(buffer[:size], old)
+                for p in range(k, size - 1):
+                    buffer[p] = buffer[p + 1]
+                size -= 1
+        x = values[i]
+        if not np.isnan(x):
+            k = np.searchsorted(buffer[:size], x)
+            for p in range(size, k, -1):
+                buffer[p] = buffer[p - 1]
+            buffer[k] = x
+            size += 1
+
+        if size < window:
+            continue
+        for j in range(m):
+            k = ranks[j]
+            out[i, j] = buffer[k]
+            if fracs[j] > 0.0:
+                out[i, j] += (buffer[k + 1] - buffer[k]) * fracs[j]
+
+    return out
+
+
+@njit(cache=True, nogil=True)
+def rolling_quantiles(values, window, q_low, q_high):
+    """
+    Computes two rolling quantiles of a 1-D array in a single pass.
+
+    Args:
+        values (numpy.ndarray): The input series as a float64 array.
+        window (int): The size of the rolling window.
+        q_low (float): The lower quantile, between 0 and 1.
+        q_high (float): The upper quantile, between 0 and 1.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The rolling lower and upper quantiles.
+        Windows that are incomplete or contain NaN are set to NaN.
+    """
+    block = rolling_quantile_block(values, window, np.array([q_low, q_high]))
+    return block[:, 0].copy(), block[:, 1].copy()
+
+
+@njit(cache=True, nogil=True)
+def rolling_moments(values, window):
+    """
+    Computes the rolling mean, min, max and standard deviation in a single pass.
+
+    The mean uses a compensated running sum and the variance Welford's
+    add/remove updates, as pandas does. Min and max come from monotonic index
+    deques, so every value is pushed and popped at most once.
+
+    Args:
+        values (numpy.ndarray): The input series as a float64 array.
+        window (int): The size of the rolling window.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: The rolling
+        mean, min, max and sample standard deviation. Windows that are incomplete or
+        contain NaN are set to NaN.
+    """
+    n = values.shape[0]
+    mean = np.full(n, np.nan)
+    low = np.full(n, np.nan)
+    high = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    if window < 1:
+        return mean, low, high, std
+
+    min_queue = np.empty(n, dtype=np.int64)
+    max_queue = np.empty(n, dtype=np.int64)
+    min_head = min_tail = max_head = max_tail = 0
+    nobs = 0
+    nan_count = 0
+    sum_x = 0.0
+    compensation = 0.0
+    mean_x = 0.0
+    ssqdm = 0.0
+
+    for i in range(n):
+        x = values[i]
+        if np.isnan(x):
+            nan_count += 1
+        else:
+            nobs += 1
+            y = x - compensation
+            t = sum_x + y
+            compensation = t - sum_x - y
+            sum_x = t
+            delta = x - mean_x
+            mean_x += delta / nobs
+            ssqdm += delta * (x - mean_x)
+            while min_tail > min_head and values[min_queue[min_tail - 1]] >= x:
+                min_tail -= 1
+            min_queue[min_tail] = i
+            min_tail += 1
+            while max_tail > max_head and values[max_queue[max_tail - 1]] <= x:
+                max_tail -= 1
+            max_queue[max_tail] = i
+            max_tail += 1
+
+        if i >= window:
+            old = values[i - window]
+            if np.isnan(old):
+                nan_count -= 1
+            elif nobs == 1:
+                nobs = 0
+                sum_x = compensation = mean_x = ssqdm = 0.0
+            else:
+                nobs -= 1
+                y = -old - compensation
+                t = sum_x + y
+                compensation = t - sum_x - y
+                sum_x = t
+                delta = old - mean_x
+                mean_x -= delta / nobs
+                ssqdm -= delta * (old - mean_x)
+            if min_tail > min_head and min_queue[min_head] <= i - window:
+                min_head += 1
+            if max_tail > max_head and max_queue[max_head] <= i - window:
+                max_head += 1
+
+        if i < window - 1 or nan_count > 0:
+            continue
+        low[i] = values[min_queue[min_head]]
+        high[i] = values[max_queue[max_head]]
+        if low[i] == high[i]:
+            # A constant window is exact, whatever rounding has accumulated
+            mean[i] = low[i]
+            if nobs > 1:
+                std[i] = 0.0
+            continue
+        mean[i] = sum_x / nobs
+        if nobs > 1:
+            std[i] = np.sqrt(max(ssqdm, 0.0) / (nobs - 1))
+
+    return mean, low, high, std
+
+
+@njit(cache=True, nogil=True)
+def rolling_skew(values, window):
+    """
+    Computes the rolling sample skewness in a single pass.
+
+    Follows pandas' `rolling().skew()`: the values are shifted by their rounded
+    mean, the first three power sums are kept as compensated running sums, and
+    windows of a single repeated value are exactly 0 while near-zero variance
+    gives NaN.
+
+    Args:
+        values (numpy.ndarray): The input series as a float64 array.
+        window (int): The size of the rolling window.
+
+    Returns:
+        numpy.ndarray: The rolling skewness. Windows that are incomplete or contain
+        NaN, and windows of fewer than 3 values, are set to NaN.
+    """
+    n = values.shape[0]
+    out = np.full(n, np.nan)
+    if window < 1:
+        return out
+
+    shifted = values.copy()
+    total = 0.0
+    count = 0
+    for i in range(n):
+        if not np.isnan(values[i]):
+            total += values[i]
+            count += 1
+    if count > 0:
+        mean = total / count
+        if np.nanmin(values) - mean > -1e5:
+            shifted -= np.copysign(np.floor(abs(mean) + 0.5), mean)
+
+    nobs = 0
+    x = xx = xxx = 0.0
+    comp_x_add = comp_xx_add = comp_xxx_add = 0.0
+    comp_x_remove = comp_xx_remove = comp_xxx_remove = 0.0
+    same_count = 0
+    previous = np.nan
+    for i in range(n):
+        if i >= window:
+            old = shifted[i - window]
+            if not np.isnan(old):
+                nobs -= 1
+                y = -old - comp_x_remove
+                t = x + y
+                comp_x_remove = t - x - y
+                x = t
+                y = -old * old - comp_xx_remove
+                t = xx + y
+                comp_xx_remove = t - xx - y
+                xx = t
+                y = -old * old * old - comp_xxx_remove
+                t = xxx + y
+                comp_xxx_remove = t - xxx - y
+                xxx = t
+        val = shifted[i]
+        if not np.isnan(val):
+            nobs += 1
+            y = val - comp_x_add
+            t = x + y
+            comp_x_add = t - x - y
+            x = t
+            y = val * val - comp_xx_add
+            t = xx + y
+            comp_xx_add = t - xx - y
+            xx = t
+            y = val * val * val - comp_xxx_add
+            t = xxx + y
+            comp_xxx_add = t - xxx - y
+            xxx = t
+            same_count = same_count + 1 if val == previous else 1
+            previous = val
+
+        if nobs < max(window, 3):
+            continue
+        a = x / nobs
+        b = xx / nobs - a * a
+        c = xxx / nobs - a * a * a - 3 * a * b
+        if same_count >= nobs:
+            out[i] = 0.0
+        elif b > 1e-14:
+            r = np.sqrt(b)
+            out[i] = np.sqrt(nobs * (nobs - 1.0)) * c / ((nobs - 2) * r * r * r)
+
+    return out
+
+
+def warm_up_kernels():
+    """
+    Compiles (or loads from the on-disk cache) every kernel in this module.
+
+    Calling this once at start-up keeps the JIT latency out of the first forecast.
+    """
+    values = np.arange(4, dtype=np.float64)
+    rolling_quantile_block(values, 2, np.array([0.25, 0.5, 0.75]))
+    rolling_quantiles(values, 2, 0.25, 0.75)
+    rolling_moments(values, 2)
+    rolling_skew(values, 3)
@@ -1,8 +1,19 @@
+import copy
+import hashlib
+import json
+import os
 import pickle
+import tempfile
 import warnings
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
+import xgboost
+from joblib import Parallel, delayed, effective_n_jobs
+from numba import cuda
+from numpy.lib.stride_tricks import sliding_window_view
 from sklearn.base import clone
 from sklearn.metrics import mean_squared_error
 from sklearn.model_selection import train_test_split
@@ -11,9 +22,16 @@ from tqdm.auto import tqdm
 from xgboost import XGBRegressor
 
 from .interfaces import IEvaluator, IForecaster, ILoader, IModel, ISaver
+from .kernels import rolling_moments, rolling_quantile_block, rolling_skew
 
 warnings.simplefilter(action="ignore", category=pd.errors.PerformanceWarning)
 
+NATIVE_MODEL_FORMAT = "xgbmodel-ubj-v1"
+NATIVE_MODEL_EXTENSION = ".json"
+# Part of every feature cache key; bump it whenever the feature code changes what
+# it computes, so arrays cached by older code are not served any more
+_FEATURE_CACHE_VERSION = 1
+
 
 class ProgressMultiOutputRegressor(MultiOutputRegressor):
     """
@@ -51,32 +69,296 @@ class ProgressMultiOutputRegressor(MultiOutputRegressor):
         if y.ndim == 1:
             raise ValueError("y must be 2-dimensional")
 
+        estimator = clone(self.estimator)
+        n_jobs = effective_n_jobs(self.n_jobs)
+        if n_jobs == 1 and _can_share_sketch(estimator):
+            self.estimators_ = _fit_shared_sketch(
+                estimator, X, y, eval_set, early_stopping_rounds, sample_weight
+            )
+            return self
+        if n_jobs > 1 and estimator.get_params().get("n_jobs") is None:
+            # Share the cores between the parallel fits instead of oversubscribing
+            estimator.set_params(n_jobs=max(1, (os.cpu_count() or 1) // n_jobs))
+
+        self.estimators_ = Parallel(n_jobs=self.n_jobs)(
+            delayed(_fit_estimator)(
+                clone(estimator),
+                X,
+                y[:, i],
+                eval_set=(
+                    [(eval_set[0][0], eval_set[0][1][:, i])]
+                    if eval_set is not None
+                    else None
+                ),
+                early_stopping_rounds=early_stopping_rounds,
+                sample_weight=sample_weight,
+            )
+            for i in tqdm(range(y.shape[1]))
+        )
+
+        return self
+
+    def predict(self, X, fast=True):
+        """
+        Predicts every output for the input features.
+
+        Args:
+            X (numpy.ndarray): The input features.
+            fast (bool, optional): Whether to read X straight from the boosters with
+                `inplace_predict` instead of building a DMatrix per estimator.
+                Defaults to True.
+
+        Returns:
+            numpy.ndarray: The predicted values, one column per output.
+        """
+        if not fast:
+            return super().predict(X)
+        return np.column_stack([_inplace_predict(e, X) for e in self.estimators_])
+
+
+class ProgressRegressorChain(MultiOutputRegressor):
+    """
+    A regressor chain that tracks progress during fitting.
+
+    Each output is fitted on the input features plus the predictions of all the
+    previous outputs, which lets later forecast steps build on earlier ones. This
+    trains noticeably slower than independent outputs because every link has to
+    score the data before the next one can be fitted, so it is opt-in.
+
+    The chained features live in one preallocated float32 buffer and the links
+    predict through `inplace_predict`, so no DMatrix is rebuilt per link.
+
+    Parameters:
+    -----------
+    estimator : object
+        The base XGBoost estimator to fit on each output of the chain.
+
+    Attributes:
+    -----------
+    estimators_ : list
+        List of fitted estimators, in chain order.
+    """
+
+    def fit(self, X, y, eval_set=None, early_stopping_rounds=None, sample_weight=None):
+        super(MultiOutputRegressor, self)._validate_data(
+            X, y, multi_output=True, accept_sparse="csc", dtype="numeric"
+        )
+        if y.ndim == 1:
+            raise ValueError("y must be 2-dimensional")
+
+        n_features = X.shape[1]
+        X_chain = self._chain_buffer(X, y.shape[1])
+        X_val_chain = (
+            self._chain_buffer(eval_set[0][0], y.shape[1])
+            if eval_set is not None
+            else None
+        )
+
         self.estimators_ = []
         for i in tqdm(range(y.shape[1])):
+            width = n_features + i
             e = clone(self.estimator)
             single_eval_set = (
-                [(eval_set[0][0], eval_set[0][1][:, i])]
+                [(X_val_chain[:, :width], eval_set[0][1][:, i])]
                 if eval_set is not None
                 else None
             )
             e = e.fit(
-                X,
+                X_chain[:, :width],
                 y[:, i],
                 eval_set=single_eval_set,
                 early_stopping_rounds=early_stopping_rounds,
                 sample_weight=sample_weight,
                 verbose=100,
             )
+            X_chain[:, width] = _inplace_predict(e, X_chain[:, :width])
+            if X_val_chain is not None:
+                X_val_chain[:, width] = _inplace_predict(e, X_val_chain[:, :width])
             self.estimators_.append(e)
 
         return self
 
+    def predict(self, X, fast=True):
+        n_features = X.shape[1]
+        X_chain = self._chain_buffer(X, len(self.estimators_))
+        for i, e in enumerate(self.estimators_):
+            width = n_features + i
+            X_chain[:, width] = (
+                _inplace_predict(e, X_chain[:, :width])
+                if fast
+                else e.predict(X_chain[:, :width])
+            )
+        return X_chain[:, n_features:]
+
+    @staticmethod
+    def _chain_buffer(X, n_outputs):
+        X = np.asarray(X)
+        buffer = np.empty(
+            (X.shape[0], X.shape[1] + n_outputs), dtype=np.float32, order="F"
+        )
+        buffer[:, : X.shape[1]] = X
+        return buffer
+
+
+def _fit_estimator(estimator, X, y, eval_set, early_stopping_rounds, sample_weight):
+    """
+    Fits one output's estimator; kept at module level so joblib can pickle it.
+
+    Args:
+        estimator (XGBRegressor): The unfitted estimator.
+        X (numpy.ndarray): The input features.
+        y (numpy.ndarray): The target values of a single output.
+        eval_set (list): The evaluation set for early stopping, or None.
+        early_stopping_rounds (int): The number of rounds without improvement to stop after.
+        sample_weight (numpy.ndarray): The sample weights, or None.
+
+    Returns:
+        XGBRegressor: The fitted estimator.
+    """
+    return estimator.fit(
+        X,
+        y,
+        eval_set=eval_set,
+        early_stopping_rounds=early_stopping_rounds,
+        sample_weight=sample_weight,
+        verbose=100,
+    )
+
+
+def _can_share_sketch(estimator):
+    """
+    Checks whether `_fit_shared_sketch` can fit an estimator exactly as its own `fit` would.
+
+    Args:
+        estimator (object): The unfitted estimator.
+
+    Returns:
+        bool: True for an `XGBRegressor` using the histogram tree method, with no
+        callbacks and no custom objective or metric.
+    """
+    return (
+        isinstance(estimator, XGBRegressor)
+        and estimator.tree_method in (None, "hist", "gpu_hist")
+        and estimator.callbacks is None
+        and not callable(estimator.objective)
+        and not callable(estimator.eval_metric)
+    )
+
+
+def _fit_shared_sketch(estimator, X, y, eval_set, early_stopping_rounds, sample_weight):
+    """
+    Fits one `XGBRegressor` per output on a single `QuantileDMatrix`.
+
+    The histogram cut points only depend on X (and the sample weights), so X is
+    sketched and binned once, and only the labels are swapped between outputs.
+    `XGBRegressor.fit` would rebuild the matrix from scratch for every output.
+
+    Args:
+        estimator (XGBRegressor): The unfitted estimator to clone for each output.
+        X (numpy.ndarray): The input features.
+        y (numpy.ndarray): The target values, one column per output.
+        eval_set (list): The evaluation set for early stopping, or None.
+        early_stopping_rounds (int): The number of rounds without improvement to stop after.
+        sample_weight (numpy.ndarray): The sample weights, or None.
+
+    Returns:
+        list: The fitted estimators, one per output.
+    """
+    dtrain = xgboost.QuantileDMatrix(
+        X,
+        label=y[:, 0],
+        weight=sample_weight,
+        missing=estimator.missing,
+        nthread=estimator.n_jobs,
+        max_bin=estimator.max_bin,
+        feature_types=estimator.feature_types,
+        enable_categorical=estimator.enable_categorical,
+    )
+    evals = []
+    if eval_set is not None:
+        X_val, y_val = eval_set[0]
+        dval = xgboost.QuantileDMatrix(
+            X_val,
+            label=y_val[:, 0],
+            ref=dtrain,
+            missing=estimator.missing,
+            nthread=estimator.n_jobs,
+            feature_types=estimator.feature_types,
+            enable_categorical=estimator.enable_categorical,
+        )
+        evals = [(dval, "validation_0")]
+    if early_stopping_rounds is None:
+        early_stopping_rounds = estimator.early_stopping_rounds
+
+    estimators = []
+    for i in tqdm(range(y.shape[1])):
+        dtrain.set_label(y[:, i])
+        if evals:
+            dval.set_label(y_val[:, i])
+        evals_result = {}
+        booster = xgboost.train(
+            estimator.get_xgb_params(),
+            dtrain,
+            num_boost_round=estimator.get_num_boosting_rounds(),
+            evals=evals,
+            early_stopping_rounds=early_stopping_rounds,
+            evals_result=evals_result,
+            verbose_eval=100,
+        )
+        e = clone(estimator)
+        e.load_model(bytearray(booster.save_raw("ubj")))
+        e.evals_result_ = evals_result
+        estimators.append(e)
+    return estimators
+
+
+def _inplace_predict(estimator, X):
+    """
+    Predicts with the booster of a fitted `XGBRegressor` without building a DMatrix.
+
+    Args:
+        estimator (XGBRegressor): The fitted estimator.
+        X (numpy.ndarray): The input features.
+
+    Returns:
+        numpy.ndarray: The predicted values, limited to the best iteration when
+        early stopping was used.
+    """
+    booster = estimator.get_booster()
+    best_iteration = booster.attr("best_iteration")
+    iteration_range = (0, int(best_iteration) + 1) if best_iteration else (0, 0)
+    return booster.inplace_predict(X, iteration_range=iteration_range)
+
 
 class IFeatureEngineer(ABC):
     @abstractmethod
     def transform(self, df, column_name, include_lead):
         pass
 
+    def transform_to_arrays(self, df, column_name, include_lead, dtype=np.float32):
+        """
+        Transforms the input DataFrame straight into model-ready arrays.
+
+        The default implementation goes through `transform`; subclasses can
+        override it to skip building the intermediate DataFrame.
+
+        Args:
+            df (pandas.DataFrame): The input DataFrame.
+            column_name (str): The name of the column to calculate features on.
+            include_lead (bool): Whether to include lead features.
+            dtype (numpy.dtype): The dtype of the returned arrays.
+
+        Returns:
+            X (numpy.ndarray): The column-major input features.
+            y (numpy.ndarray): The target values.
+        """
+        df_engineered, X_columns, y_columns = self.transform(
+            df, column_name=column_name, include_lead=include_lead
+        )
+        X = np.asfortranarray(df_engineered[X_columns].to_numpy(dtype=dtype))
+        y = df_engineered[y_columns].to_numpy(dtype=dtype)
+        return X, y
+
 
 # TODO: Add lad and lead values as features
 class FeatureEngineer(IFeatureEngineer):
@@ -87,12 +369,44 @@ class FeatureEngineer(IFeatureEngineer):
         window_size (int): The size of the rolling window for calculating rolling features.
         lag (int): The lag value for creating lag features.
         lead (int): The lead value for creating lead features.
+        cache_dir (str): Optional directory where `transform_to_arrays`, and so
+            training and forecasting, stores the arrays it builds, keyed by a hash of
+            the input series and the feature settings.
+        incremental (bool): Whether `transform_to_arrays` keeps the time, rolling and
+            lag features of the last frame it saw and reuses them for overlapping
+            frames, such as a sliding history window. Features of reused rows can
+            differ from a fresh computation by rounding only, so this is off by
+            default.
     """
 
-    def __init__(self, window_size=24, lag=7 * 24, lead=24):
+    TIME_COLUMNS = (
+        "hour",
+        "day_of_week",
+        "month",
+        "day_of_month",
+        "week_of_year",
+        "is_weekend",
+    )
+    ROLLING_COLUMNS = (
+        "rolling_mean",
+        "rolling_min",
+        "rolling_max",
+        "rolling_std",
+        "rolling_skew",
+        "rolling_median",
+        "rolling_quantile_25",
+        "rolling_quantile_75",
+    )
+
+    def __init__(
+        self, window_size=24, lag=7 * 24, lead=24, cache_dir=None, incremental=False
+    ):
         self.window_size = window_size
         self.lag = lag
         self.lead = lead
+        self.cache_dir = cache_dir
+        self.incremental = incremental
+        self._engineered_cache = None
 
     def transform(self, df, column_name="value", include_lead=True):
         """
@@ -109,19 +423,319 @@ class FeatureEngineer(IFeatureEngineer):
             y_columns (list): The list of column names for the target values.
 
         """
-        df = df.copy()
-        X_columns = [column_name]
-        y_columns = []
-        df, columns = self.add_time_features(df)
-        X_columns.extend(columns)
-        df, columns = self.add_rolling_features(df, column_name)
-        X_columns.extend(columns)
-        df, columns = self.add_lag_features(df, column_name, self.lag)
-        X_columns.extend(columns)
-        if include_lead:
-            df, columns = self.add_lead_features(df, column_name, self.lead)
-            y_columns.extend(columns)
-        return df.dropna(), X_columns, y_columns
+        values = df[column_name].to_numpy(dtype=np.float64)
+        lag_columns = [f"{column_name}_lag_{i}" for i in range(1, self.lag)]
+        lead = self.lead if include_lead else 0
+        y_columns = [f"{column_name}_lead_{i}" for i in range(1, lead + 1)]
+        X_columns = [column_name, *self.TIME_COLUMNS, *self.ROLLING_COLUMNS]
+        X_columns.extend(lag_columns)
+
+        # Rows in the warm-up or lead horizon are always incomplete, so only the
+        # rows in between are ever materialized
+        start = max(self.window_size, self.lag) - 1
+        rows = slice(start, max(start, len(df) - lead))
+        index = df.index[rows]
+
+        # The new columns go into their own frame so the input is never copied
+        new_cols = self.time_features(index)
+        new_cols.update(zip(self.ROLLING_COLUMNS, self.rolling_block(values)[rows].T))
+        new_cols.update(zip(lag_columns, self.lag_block(values, self.lag)[rows].T))
+        new_cols.update(zip(y_columns, self.lead_block(values, lead)[rows].T))
+        df_out = pd.concat(
+            [df.iloc[rows], pd.DataFrame(new_cols, index=index)], axis=1, copy=False
+        )
+        if df_out.isna().to_numpy().any():
+            df_out = df_out.dropna()
+        return df_out, X_columns, y_columns
+
+    def _cache_key(self, df, column_name, lead, dtype):
+        """
+        Hashes everything the output of `transform_to_arrays` depends on.
+
+        Parameters:
+        - df (pandas.DataFrame): The input DataFrame.
+        - column_name (str): The name of the column to calculate features on.
+        - lead (int): The number of lead values to add.
+        - dtype (numpy.dtype): The dtype of the arrays.
+
+        Returns:
+        - key (str): A hex digest identifying the arrays.
+
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        series = df[column_name]
+        digest.update(
+            pd.util.hash_pandas_object(series, index=True).to_numpy().tobytes()
+        )
+        digest.update(
+            f"{_FEATURE_CACHE_VERSION}|{column_name}|{self.window_size}|{self.lag}|"
+            f"{lead}|{np.dtype(dtype).str}".encode()
+        )
+        return digest.hexdigest()
+
+    def transform_to_arrays(
+        self, df, column_name="value", include_lead=True, dtype=np.float32
+    ):
+        """
+        Builds the same features as `transform` without materializing a DataFrame.
+
+        Every feature group is computed as a raw block and copied into a single
+        preallocated column-major matrix, which is the layout XGBoost's `hist`
+        method reads features in.
+
+        Args:
+            df (pandas.DataFrame): The input DataFrame.
+            column_name (str): The name of the column to calculate features on.
+            include_lead (bool): Whether to include lead features.
+            dtype (numpy.dtype): The dtype of the returned arrays.
+
+        Returns:
+            X (numpy.ndarray): The column-major input features.
+            y (numpy.ndarray): The target values.
+        """
+        if self.cache_dir is None:
+            return self._build_arrays(df, column_name, include_lead, dtype)
+
+        lead = self.lead if include_lead else 0
+        cache_path = os.path.join(
+            self.cache_dir,
+            f"feats_{self._cache_key(df, column_name, lead, dtype)}.npz",
+        )
+        if os.path.exists(cache_path):
+            with np.load(cache_path) as cached:
+                return cached["X"], cached["y"]
+
+        X, y = self._build_arrays(df, column_name, include_lead, dtype)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        # Write to a file of our own, then rename it into place, so concurrent
+        # writers never share a file and readers never see a partial one
+        with tempfile.NamedTemporaryFile(
+            dir=self.cache_dir, suffix=".tmp", delete=False
+        ) as f:
+            np.savez(f, X=X, y=y)
+        os.replace(f.name, cache_path)
+        return X, y
+
+    def _build_arrays(self, df, column_name, include_lead, dtype):
+        values = df[column_name].to_numpy(dtype=np.float64)
+        blocks = [values[:, np.newaxis], *self._causal_blocks(df.index, values)]
+        y_block = self.lead_block(values, self.lead if include_lead else 0)
+
+        # Same rows as `transform`'s dropna: keep rows where no feature is missing.
+        # Reused rows may have been computed with history before this frame, so the
+        # warm-up rows are excluded explicitly.
+        valid = ~np.isnan(y_block).any(axis=1)
+        valid[: max(self.window_size, self.lag) - 1] = False
+        for block in blocks:
+            if block.dtype.kind == "f":
+                valid &= ~np.isnan(block).any(axis=1)
+
+        rows = np.flatnonzero(valid)
+        # The kept rows are nearly always one range, which copies as a plain slice
+        # straight into the output instead of through a boolean-indexed temporary
+        selection = (
+            slice(rows[0], rows[-1] + 1)
+            if len(rows) and rows[-1] - rows[0] + 1 == len(rows)
+            else None
+        )
+
+        def fill(out, block):
+            out[...] = block[selection if selection is not None else valid]
+
+        width = sum(block.shape[1] for block in blocks)
+        X = np.empty((len(rows), width), dtype=dtype, order="F")
+        start = 0
+        for block in blocks:
+            stop = start + block.shape[1]
+            fill(X[:, start:stop], block)
+            start = stop
+
+        y = np.empty((len(rows), y_block.shape[1]), dtype=dtype)
+        fill(y, y_block)
+        return X, y
+
+    def _causal_blocks(self, index, values):
+        """
+        Returns the time, rolling and lag blocks, reusing rows of the cached frame.
+
+        These features only look backwards, so a row computed for an earlier frame is
+        still valid for any later frame that contains it. A frame that starts inside
+        the cached one only needs features for the rows past the cached end.
+
+        Parameters:
+        - index (pandas.DatetimeIndex): The index of the input frame.
+        - values (numpy.ndarray): The float64 values of the input column.
+
+        Returns:
+        - blocks (list): The time, rolling and lag blocks, one row per input row.
+
+        """
+        if not self.incremental or not index.is_monotonic_increasing:
+            return self._compute_causal_blocks(index, values)
+
+        cache = self._engineered_cache
+        if (
+            cache is not None
+            and cache["settings"] == (self.window_size, self.lag)
+            and len(index) > 0
+        ):
+            p = cache["index"].searchsorted(index[0])
+            overlap = min(len(cache["index"]) - p, len(index))
+            if (
+                overlap > 0
+                and cache["index"][p : p + overlap].equals(index[:overlap])
+                and np.array_equal(
+                    cache["values"][p : p + overlap], values[:overlap], equal_nan=True
+                )
+            ):
+                if overlap < len(index):
+                    cache = self._extend_cache(p, index[overlap:], values[overlap:])
+                    p = 0
+                return [block[p : p + len(index)] for block in cache["blocks"]]
+
+        # Keep a private copy so later changes to the caller's frame are detected
+        values = values.copy()
+        blocks = self._compute_causal_blocks(index, values)
+        self._engineered_cache = {
+            "settings": (self.window_size, self.lag),
+            "index": index,
+            "values": values,
+            "blocks": blocks,
+        }
+        return blocks
+
+    def _extend_cache(self, start, new_index, new_values):
+        """
+        Drops the cached rows before `start` and appends features for new rows.
+
+        Each block of the new rows is computed from the new values plus only as much
+        cached history as it needs: none for the time features, `window_size - 1`
+        rows for the rolling features and `lag - 1` rows for the lags.
+
+        Parameters:
+        - start (int): The first cached row to keep.
+        - new_index (pandas.DatetimeIndex): The index of the rows to append.
+        - new_values (numpy.ndarray): The float64 values of the rows to append.
+
+        Returns:
+        - cache (dict): The updated cache.
+
+        """
+        cache = self._engineered_cache
+        cached_values = cache["values"]
+
+        def with_history(rows):
+            rows = min(rows, len(cached_values))
+            history = cached_values[len(cached_values) - rows :]
+            return np.concatenate([history, new_values]), rows
+
+        rolling_values, rolling_rows = with_history(self.window_size - 1)
+        lag_values, lag_rows = with_history(self.lag - 1)
+        new_blocks = [
+            self.time_block(new_index),
+            self.rolling_block(rolling_values)[rolling_rows:],
+            self.lag_block(lag_values, self.lag)[lag_rows:],
+        ]
+
+        self._engineered_cache = {
+            "settings": cache["settings"],
+            "index": cache["index"][start:].append(new_index),
+            "values": np.concatenate([cached_values[start:], new_values]),
+            "blocks": [
+                np.concatenate([block[start:], new_block])
+                for block, new_block in zip(cache["blocks"], new_blocks)
+            ],
+        }
+        return self._engineered_cache
+
+    def _compute_causal_blocks(self, index, values):
+        return [
+            self.time_block(index),
+            self.rolling_block(values),
+            self.lag_block(values, self.lag),
+        ]
+
+    def time_block(self, index):
+        """
+        Computes the time features of a DatetimeIndex as one block.
+
+        Parameters:
+        - index (pandas.DatetimeIndex): The index to derive the features from.
+
+        Returns:
+        - block (numpy.ndarray): An array of shape (len(index), len(TIME_COLUMNS)).
+
+        """
+        block = np.empty(
+            (len(index), len(self.TIME_COLUMNS)), dtype=np.int16, order="F"
+        )
+        block[:, 0] = index.hour
+        block[:, 1] = index.dayofweek
+        block[:, 2] = index.month
+        block[:, 3] = index.day
+        block[:, 4] = index.isocalendar().week.to_numpy(dtype=np.int16)
+        block[:, 5] = block[:, 1] > 4
+        return block
+
+    def rolling_block(self, values):
+        """
+        Computes the rolling features of a series as one block.
+
+        Parameters:
+        - values (numpy.ndarray): The float64 values to calculate rolling features on.
+
+        Returns:
+        - block (numpy.ndarray): An array of shape (len(values), len(ROLLING_COLUMNS)).
+
+        """
+        block = np.empty(
+            (len(values), len(self.ROLLING_COLUMNS)), dtype=np.float64, order="F"
+        )
+        block[:, 0], block[:, 1], block[:, 2], block[:, 3] = rolling_moments(
+            values, self.window_size
+        )
+        block[:, 4] = rolling_skew(values, self.window_size)
+        block[:, 5:8] = rolling_quantile_block(
+            values, self.window_size, np.array([0.5, 0.25, 0.75])
+        )
+        return block
+
+    def lag_block(self, values, lag):
+        """
+        Computes the lag features of a series as one block.
+
+        Parameters:
+        - values (numpy.ndarray): The float64 values to create lag features for.
+        - lag (int): The number of lag values to add.
+
+        Returns:
+        - block (numpy.ndarray): A read-only view of shape (len(values), lag - 1).
+
+        """
+        width = max(lag - 1, 0)
+        if width == 0:
+            return np.empty((len(values), 0))
+        # Row r of the window over the NaN-padded series holds values[r - width:r]
+        padded = np.concatenate([np.full(width, np.nan), values])
+        return sliding_window_view(padded, width)[: len(values), ::-1]
+
+    def lead_block(self, values, lead):
+        """
+        Computes the lead features of a series as one block.
+
+        Parameters:
+        - values (numpy.ndarray): The float64 values to create lead features for.
+        - lead (int): The number of lead values to add.
+
+        Returns:
+        - block (numpy.ndarray): A read-only view of shape (len(values), lead).
+
+        """
+        if lead <= 0:
+            return np.empty((len(values), 0))
+        # Row r of the window over the NaN-padded series holds values[r + 1:r + lead + 1]
+        padded = np.concatenate([values[1:], np.full(lead, np.nan)])
+        return sliding_window_view(padded, lead)[: len(values)]
 
     def add_time_features(self, df):
         """
@@ -135,21 +749,30 @@ class FeatureEngineer(IFeatureEngineer):
         - columns (list): The list of column names for the time features.
 
         """
-        df["hour"] = df.index.hour
-        df["day_of_week"] = df.index.dayofweek
-        df["month"] = df.index.month
-        df["day_of_month"] = df.index.day
-        df["week_of_year"] = df.index.isocalendar().week
-        df["is_weekend"] = (df.index.dayofweek > 4).astype(int)
-        columns = [
-            "hour",
-            "day_of_week",
-            "month",
-            "day_of_month",
-            "week_of_year",
-            "is_weekend",
-        ]
-        return df, columns
+        # One assign materializes a single new block instead of six insertions
+        df = df.assign(**self.time_features(df.index))
+        return df, list(self.TIME_COLUMNS)
+
+    def time_features(self, index):
+        """
+        Computes the time features of a DatetimeIndex as named columns.
+
+        Parameters:
+        - index (pandas.DatetimeIndex): The index to derive the features from.
+
+        Returns:
+        - features (dict): The int16/int8 feature arrays keyed by TIME_COLUMNS.
+
+        """
+        dow = index.dayofweek.to_numpy()
+        return {
+            "hour": index.hour.to_numpy().astype(np.int16),
+            "day_of_week": dow.astype(np.int16),
+            "month": index.month.to_numpy().astype(np.int16),
+            "day_of_month": index.day.to_numpy().astype(np.int16),
+            "week_of_year": index.isocalendar().week.to_numpy().astype(np.int16),
+            "is_weekend": (dow > 4).astype(np.int8),
+        }
 
     def add_rolling_features(self, df, column_name):
         """
@@ -163,29 +786,8 @@ class FeatureEngineer(IFeatureEngineer):
         - df (pandas.DataFrame): The DataFrame with added rolling features.
         - columns (list): The list of column names for the rolling features.
         """
-
-        df["rolling_mean"] = df[column_name].rolling(window=self.window_size).mean()
-        df["rolling_min"] = df[column_name].rolling(window=self.window_size).min()
-        df["rolling_max"] = df[column_name].rolling(window=self.window_size).max()
-        df["rolling_std"] = df[column_name].rolling(window=self.window_size).std()
-        df["rolling_skew"] = df[column_name].rolling(window=self.window_size).skew()
-        df["rolling_median"] = df[column_name].rolling(window=self.window_size).median()
-        df["rolling_quantile_25"] = (
-            df[column_name].rolling(window=self.window_size).quantile(0.25)
-        )
-        df["rolling_quantile_75"] = (
-            df[column_name].rolling(window=self.window_size).quantile(0.75)
-        )
-        columns = [
-            "rolling_mean",
-            "rolling_min",
-            "rolling_max",
-            "rolling_std",
-            "rolling_skew",
-            "rolling_median",
-            "rolling_quantile_25",
-            "rolling_quantile_75",
-        ]
+        columns = list(self.ROLLING_COLUMNS)
+        df[columns] = self.rolling_block(df[column_name].to_numpy(dtype=np.float64))
         return df, columns
 
     def add_lag_features(self, df, column_name, lag):
@@ -202,10 +804,8 @@ class FeatureEngineer(IFeatureEngineer):
         - columns (list): The list of column names for the lag features.
 
         """
-        for i in range(1, lag):
-            df[f"{column_name}_lag_{i}"] = df[column_name].shift(i)
-
         columns = [f"{column_name}_lag_{i}" for i in range(1, lag)]
+        df[columns] = self.lag_block(df[column_name].to_numpy(dtype=np.float64), lag)
         return df, columns
 
     def add_lead_features(self, df, column_name, lead):
@@ -222,19 +822,61 @@ class FeatureEngineer(IFeatureEngineer):
         - columns (list): The list of column names for the lead features.
 
         """
-        for i in range(1, lead + 1):
-            df[f"{column_name}_lead_{i}"] = df[column_name].shift(-i)
-
         columns = [f"{column_name}_lead_{i}" for i in range(1, lead + 1)]
+        df[columns] = self.lead_block(df[column_name].to_numpy(dtype=np.float64), lead)
         return df, columns
 
 
+def _as_float32(array):
+    """
+    Converts an array to float32, keeping its memory layout and avoiding a copy
+    when it already is float32.
+
+    Args:
+        array (array-like): The input array.
+
+    Returns:
+        numpy.ndarray: The float32 array.
+    """
+    return np.asarray(array, dtype=np.float32)
+
+
+def _cuda_available():
+    """
+    Checks whether XGBoost can train on a CUDA device.
+
+    Returns:
+        bool: True if XGBoost was built with CUDA and a GPU is visible.
+    """
+    if not xgboost.build_info().get("USE_CUDA", False):
+        return False
+    return cuda.is_available()
+
+
 class XGBModel(IModel):
     """
     XGBModel is a class that represents an XGBoost model for forecasting.
 
+    Args:
+        params (dict, optional): Parameters passed to each `XGBRegressor`.
+        device (str, optional): The device to train on. Use "cuda" (or "cuda:<ordinal>")
+            to build histograms on the GPU, or "auto" to use the GPU only when XGBoost
+            was built with CUDA and a device is visible. Defaults to "cpu".
+        use_chain (bool, optional): Whether to chain the outputs so each forecast step
+            also sees the predictions of the previous steps. Chaining is slower to
+            train than independent outputs. Defaults to False.
+        n_jobs (int, optional): The number of outputs to fit in parallel. Each fit then
+            gets an equal share of the cores unless `params` sets `n_jobs`. Ignored
+            when `use_chain` is set. Defaults to None (sequential).
+        multi_output_tree (bool, optional): Whether to train a single XGBoost model whose
+            trees have one leaf value per output, instead of one model per output.
+            Requires XGBoost 2.0; older versions fall back to one model per output.
+            Defaults to False.
+
     Attributes:
         model: The underlying XGBoost regressor model.
+        device (str): The device the model trains on.
+        config (dict): The constructor arguments, used to rebuild the model on load.
 
     Methods:
         fit(X, y): Fits the XGBoost model to the given training data.
@@ -242,7 +884,16 @@ class XGBModel(IModel):
 
     """
 
-    def __init__(self, params=None):
+    def __init__(
+        self,
+        params=None,
+        device="cpu",
+        use_chain=False,
+        n_jobs=None,
+        multi_output_tree=False,
+    ):
+        if use_chain and multi_output_tree:
+            raise ValueError("use_chain and multi_output_tree are mutually exclusive")
         if params is None:
             params = {
                 "random_state": 42,
@@ -250,9 +901,64 @@ class XGBModel(IModel):
                 "max_depth": 5,
                 "learning_rate": 0.1,
                 "objective": "reg:squarederror",
+                "max_bin": 256,
             }
-
-        self.model = ProgressMultiOutputRegressor(XGBRegressor(**params))
+        if device == "auto":
+            device = "cuda" if _cuda_available() else "cpu"
+        if device.startswith("cuda"):
+            params = {**params, "tree_method": "hist", "device": device}
+
+        if multi_output_tree and int(xgboost.__version__.split(".")[0]) < 2:
+            warnings.warn(
+                "multi_output_tree requires XGBoost 2.0, fitting one model per output"
+            )
+            multi_output_tree = False
+
+        self.device = device
+        self.multi_output_tree = multi_output_tree
+        self.config = {
+            "params": params,
+            "device": device,
+            "use_chain": use_chain,
+            "n_jobs": n_jobs,
+            "multi_output_tree": multi_output_tree,
+        }
+        if multi_output_tree:
+            self.model = XGBRegressor(
+                **{
+                    **params,
+                    "tree_method": "hist",
+                    "multi_strategy": "multi_output_tree",
+                }
+            )
+        else:
+            regressor = (
+                ProgressRegressorChain if use_chain else ProgressMultiOutputRegressor
+            )
+            self.model = regressor(XGBRegressor(**params), n_jobs=n_jobs)
+
+    def __setstate__(self, state):
+        # Models pickled before the device and multi-output options existed only
+        # hold `model`, which is always one regressor per output on the CPU
+        if "config" not in state:
+            regressor = state["model"]
+            state = {
+                "device": "cpu",
+                "multi_output_tree": False,
+                "config": {
+                    "params": {
+                        key: value
+                        for key, value in regressor.estimator.get_params().items()
+                        if value is not None
+                    },
+                    "device": "cpu",
+                    "use_chain": False,
+                    "n_jobs": getattr(regressor, "n_jobs", None),
+                    "multi_output_tree": False,
+                },
+                **state,
+            }
+        self.__dict__.update(state)
 
     def fit(self, X, y, eval_set=None, early_stopping_rounds=None):
         """
@@ -264,23 +970,119 @@ class XGBModel(IModel):
             eval_set: The evaluation set for early stopping.
             early_stopping_rounds: The number of early stopping rounds.
         """
-
+        # XGBoost bins float32 features and labels, so cast once up front rather
+        # than inside every per-output DMatrix
+        X, y = _as_float32(X), _as_float32(y)
+        if eval_set is not None:
+            eval_set = [
+                (_as_float32(X_val), _as_float32(y_val)) for X_val, y_val in eval_set
+            ]
+
+        if self.multi_output_tree:
+            # The native multi-output trees take the 2-D labels as they are
+            self.model.fit(
+                X,
+                y,
+                eval_set=eval_set,
+                early_stopping_rounds=early_stopping_rounds,
+                verbose=100,
+            )
+            return
         self.model.fit(
             X, y, eval_set=eval_set, early_stopping_rounds=early_stopping_rounds
         )
 
-    def predict(self, X):
+    def predict(self, X, fast_predict=True):
         """
         Makes predictions using the trained XGBoost model.
 
         Args:
             X: The input features for making predictions.
+            fast_predict (bool, optional): Whether to predict with the boosters'
+                `inplace_predict`, which skips building a DMatrix for every output.
+                Defaults to True.
 
         Returns:
             The predicted values.
 
         """
-        return self.model.predict(X)
+        X = _as_float32(X)
+        if self.multi_output_tree:
+            return (
+                _inplace_predict(self.model, X)
+                if fast_predict
+                else self.model.predict(X)
+            )
+        return self.model.predict(X, fast=fast_predict)
+
+    def save_native(self, file_path):
+        """
+        Saves the model as a JSON manifest plus one native XGBoost file per booster.
+
+        The boosters are written next to the manifest as `<name>_<i>.ubj`. Unlike a
+        pickle, the native format does not depend on the installed sklearn or
+        XGBoost wrapper versions and loads considerably faster.
+
+        Args:
+            file_path (str): The path to the manifest file.
+
+        Raises:
+            TypeError: If the model parameters cannot be stored as JSON.
+        """
+        file_path = os.fspath(file_path)
+        base, _ = os.path.splitext(file_path)
+        estimators = self._fitted_estimators()
+        booster_files = [
+            f"{os.path.basename(base)}_{i}.ubj" for i in range(len(estimators))
+        ]
+        # Serialize first so unsupported params fail before anything is written
+        manifest = json.dumps(
+            {
+                "format": NATIVE_MODEL_FORMAT,
+                "config": self.config,
+                "boosters": booster_files,
+            }
+        )
+
+        directory = os.path.dirname(file_path)
+        for estimator, booster_file in zip(estimators, booster_files):
+            estimator.save_model(os.path.join(directory, booster_file))
+        with open(file_path, "w") as f:
+            f.write(manifest)
+
+    @classmethod
+    def load_native(cls, file_path, manifest):
+        """
+        Rebuilds a model saved with `save_native`.
+
+        Args:
+            file_path (str): The path to the manifest file.
+            manifest (dict): The parsed manifest.
+
+        Returns:
+            XGBModel: The loaded model.
+        """
+        model = cls(**manifest["config"])
+        directory = os.path.dirname(os.fspath(file_path))
+
+        def load_booster(booster_file):
+            estimator = XGBRegressor()
+            estimator.load_model(os.path.join(directory, booster_file))
+            return estimator
+
+        estimators = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(load_booster)(booster_file) for booster_file in manifest["boosters"]
+        )
+        if estimators and model.multi_output_tree:
+            model.model = estimators[0]
+        elif estimators:
+            model.model.estimators_ = estimators
+        return model
+
+    def _fitted_estimators(self):
+        if self.multi_output_tree:
+            return [self.model] if self.model.__sklearn_is_fitted__() else []
+        return getattr(self.model, "estimators_", [])
 
 
 class DataPreprocessor:
@@ -289,10 +1091,12 @@ class DataPreprocessor:
         feature_engineer: IFeatureEngineer,
         history_length=7 * 24,
         forecast_length=24,
+        dtype=np.float32,
     ):
         self.history_length = history_length
         self.forecast_length = forecast_length
         self.feature_engineer = feature_engineer
+        self.dtype = dtype
 
     def preprocess_data(self, df, column_name, include_lead=True):
         """
@@ -304,22 +1108,17 @@ class DataPreprocessor:
             include_lead (bool): Whether to include lead features.
 
         Returns:
-            X (array-like): The input features.
-            y (array-like): The target values.
+            X (numpy.ndarray): The input features as a column-major matrix.
+            y (numpy.ndarray): The target values.
         """
 
-        assert (
-            len(df) >= self.history_length + self.forecast_length
-        ), "Input data must be at least history_length + forecast_length"
-
-        df_engineered, X_columns, y_columns = self.feature_engineer.transform(
-            df, column_name=column_name, include_lead=include_lead
+        assert len(df) >= self.history_length + self.forecast_length, (
+            "Input data must be at least history_length + forecast_length"
         )
 
-        X = df_engineered[X_columns].values
-        y = df_engineered[y_columns].values
-
-        return X, y
+        return self.feature_engineer.transform_to_arrays(
+            df, column_name=column_name, include_lead=include_lead, dtype=self.dtype
+        )
 
 
 class TimeSeriesForecaster(IForecaster, IEvaluator, ISaver, ILoader):
@@ -374,6 +1173,9 @@ class TimeSeriesForecaster(IForecaster, IEvaluator, ISaver, ILoader):
         """
         Performs forecasting on the input DataFrame and target column.
 
+        The features are built like the training ones, so they are read from the
+        feature engineer's `cache_dir` when it already holds them.
+
         Args:
             df (pandas.DataFrame): The input DataFrame.
             column_name (str): The name of the column to forecast.
@@ -382,19 +1184,54 @@ class TimeSeriesForecaster(IForecaster, IEvaluator, ISaver, ILoader):
         Returns:
             array-like: The forecasted values.
         """
-        assert (
-            len(df) >= self.data_preprocessor.history_length
-        ), "Input data must be at least history_length"
-
-        # Feature engineer the dataframe
-        df_engineered, X_columns, _ = self.data_preprocessor.feature_engineer.transform(
-            df, column_name=column_name, include_lead=include_lead
+        assert len(df) >= self.data_preprocessor.history_length, (
+            "Input data must be at least history_length"
         )
 
-        X = df_engineered[X_columns].values
+        # Feature engineer straight into the array layout the model was trained on
+        X, _ = self.data_preprocessor.feature_engineer.transform_to_arrays(
+            df,
+            column_name=column_name,
+            include_lead=include_lead,
+            dtype=self.data_preprocessor.dtype,
+        )
 
         return self.model.predict(X)
 
+    def forecast_many(self, dfs, column_name, include_lead=False):
+        """
+        Performs forecasting on several input DataFrames with a single predict call.
+
+        Each DataFrame is feature engineered on its own, exactly as `forecast`
+        would, and the feature rows are then stacked so the model's fixed cost per
+        predict call is paid once instead of once per DataFrame.
+
+        Args:
+            dfs (list): The input DataFrames.
+            column_name (str): The name of the column to forecast.
+            include_lead (bool): Whether to include lead features.
+
+        Returns:
+            list: The forecasted values of each DataFrame, as `forecast` returns them.
+        """
+        blocks = []
+        for df in dfs:
+            assert len(df) >= self.data_preprocessor.history_length, (
+                "Input data must be at least history_length"
+            )
+            X, _ = self.data_preprocessor.feature_engineer.transform_to_arrays(
+                df,
+                column_name=column_name,
+                include_lead=include_lead,
+                dtype=self.data_preprocessor.dtype,
+            )
+            blocks.append(X)
+        if not blocks:
+            return []
+
+        y = self.model.predict(np.concatenate(blocks))
+        return np.split(y, np.cumsum([len(X) for X in blocks])[:-1])
+
     def evaluate(self, y_true, y_pred):
         """
         Evaluates the model's performance using the true and predicted values.
@@ -413,10 +1250,32 @@ class TimeSeriesForecaster(IForecaster, IEvaluator, ISaver, ILoader):
         """
         Saves the model to a file.
 
+        An `XGBModel` saved to a `.json` path is written with
+        `XGBModel.save_native`; any other path gets a pickle.
+
         Args:
             file_path (str): The path to the file.
 
+        Raises:
+            ValueError: If a `.json` path is given for a model that cannot be saved
+                natively.
+
         """
+        file_path = os.fspath(file_path)
+        if file_path.endswith(NATIVE_MODEL_EXTENSION):
+            if not isinstance(self.model, XGBModel):
+                raise ValueError(
+                    f"Only an XGBModel can be saved to {file_path}; "
+                    "use a .pkl path to pickle the model"
+                )
+            try:
+                self.model.save_native(file_path)
+            except TypeError as e:
+                raise ValueError(
+                    f"The model parameters cannot be stored in {file_path}; "
+                    "use a .pkl path to pickle the model"
+                ) from e
+            return
         with open(file_path, "wb") as f:
             pickle.dump(self.model, f)
 
@@ -425,6 +1284,10 @@ class TimeSeriesForecaster(IForecaster, IEvaluator, ISaver, ILoader):
         """
         Loads a model from a file.
 
+        A `.json` path must hold a manifest written by `XGBModel.save_native`; any
+        other path is unpickled. Files are cached per path until they change, and
+        every load returns its own copy of the model.
+
         Args:
             file_path (str): The path to the file.
 
@@ -434,11 +1297,36 @@ class TimeSeriesForecaster(IForecaster, IEvaluator, ISaver, ILoader):
         Raises:
             FileNotFoundError: If the file is not found.
             pickle.UnpicklingError: If there is an error while unpickling the model.
+            ValueError: If a `.json` file is not a native model manifest.
 
         """
         try:
-            with open(file_path, "rb") as f:
-                return pickle.load(f)
+            file_path = os.fspath(file_path)
+            model = _load_model_cached(
+                os.path.realpath(file_path), os.stat(file_path).st_mtime_ns
+            )
+            # Callers may refit or tweak the model, so never hand out the cached one
+            return copy.deepcopy(model)
         except (FileNotFoundError, pickle.UnpicklingError) as e:
             print(f"Failed to load model from {file_path}")
             raise e
+
+
+@lru_cache(maxsize=4)
+def _load_model_cached(file_path, mtime_ns):
+    # mtime_ns is only part of the cache key, so rewriting the file reloads it
+    if not file_path.endswith(NATIVE_MODEL_EXTENSION):
+        with open(file_path, "rb") as f:
+            return pickle.load(f)
+
+    with open(file_path) as f:
+        try:
+            manifest = json.load(f)
+        except json.JSONDecodeError:
+            manifest = None
+    if not isinstance(manifest, dict) or manifest.get("format") != NATIVE_MODEL_FORMAT:
+        raise ValueError(
+            f"{file_path} is not a model saved with XGBModel.save_native "
+            f"(format {NATIVE_MODEL_FORMAT})"
+        )
+    return XGBModel.load_native(file_path, manifest)
@@ -1,6 +1,9 @@
 from datetime import date, timedelta
+from itertools import pairwise
 
+import numpy as np
 import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
 from tqdm import tqdm
 
 from scripts.assets import Battery
@@ -23,6 +26,12 @@ class EnergyMarketSimulator:
         pnl_calculator (PnLCalculator): The P&L calculator used in the simulation.
         scheduler (BatteryOptimizationScheduler): The battery optimization scheduler used in the simulation.
         log_level (int, optional): The log level for logging messages. Defaults to Logger.INFO.
+        n_jobs (int, optional): The number of processes used to solve the daily schedules.
+            With more than one, every day is planned up front from the battery's starting
+            parameters, and the schedules are then applied to the battery in order. This
+            is only done when applying a day cannot change the efficiencies the next day
+            is planned with; otherwise the days are planned one by one, as with 1.
+            Defaults to 1, which plans each day after the previous one has been applied.
 
     Methods:
         process_daily_schedule(schedule_df: pd.DataFrame) -> None:
@@ -45,6 +54,7 @@ class EnergyMarketSimulator:
         pnl_calculator: PnLCalculator,
         scheduler: BatteryOptimizationScheduler,
         log_level: int = Logger.INFO,
+        n_jobs: int = 1,
     ):
         self.logger = Logger(log_level)
         assert end_date >= start_date, "End date must be after start date."
@@ -54,6 +64,7 @@ class EnergyMarketSimulator:
         self.price_model = price_model
         self.pnl_calculator = pnl_calculator
         self.scheduler = scheduler
+        self.n_jobs = n_jobs
 
     def process_daily_schedule(self, schedule_df: pd.DataFrame) -> None:
         """
@@ -65,33 +76,81 @@ class EnergyMarketSimulator:
         Returns:
             None
         """
-        for _, row in schedule_df.iterrows():
-            charge_value = row["Charge"]
-            discharge_value = row["Discharge"]
-            if charge_value > 0:
-                self.battery.charge(charge_value)
-            elif discharge_value > 0:
-                self.battery.discharge(discharge_value)
-            elif charge_value == 0.0 and discharge_value == 0.0:
-                self.battery.charge(charge_value)
-
-    def run_daily_operation(self, prices: list, actual_prices: list) -> tuple:
+        self.battery.apply_schedule(
+            schedule_df["Charge"].to_numpy().tolist(),
+            schedule_df["Discharge"].to_numpy().tolist(),
+        )
+
+    def run_daily_operation(
+        self,
+        prices: list,
+        actual_prices: list,
+        schedule_df: pd.DataFrame | None = None,
+    ) -> tuple:
         """
         Run the daily operation by creating a schedule, processing the schedule, and calculating the P&L.
 
         Args:
             prices (list): The envelope prices for the day.
             actual_prices (list): The noisy prices for the day.
+            schedule_df (pd.DataFrame, optional): A schedule already created for the day.
+                Defaults to None, which creates it from the envelope prices.
 
         Returns:
             tuple: A tuple containing the schedule DataFrame and the daily P&L.
         """
-        schedule_df = self.scheduler.create_schedule(prices)
-        self.logger.debug(f"Schedule for {self.start_date}: {schedule_df}")
+        if schedule_df is None:
+            schedule_df = self.scheduler.create_schedule(prices)
+        self.logger.debug("Schedule for %s: %s", self.start_date, schedule_df)
         self.process_daily_schedule(schedule_df)
         pnl = self.pnl_calculator.calculate(schedule_df, actual_prices)
         return schedule_df, pnl
 
+    def create_schedules(self, daily_prices: list) -> list:
+        """
+        Create the schedules for several days in parallel.
+
+        The days are split into one contiguous chunk per process, and each process
+        solves its chunk in order with its own copy of the scheduler, so a process
+        keeps reusing the model it built for its first day.
+
+        Args:
+            daily_prices (list): The envelope prices for each day.
+
+        Returns:
+            list: The schedule DataFrame for each day.
+        """
+        n_chunks = min(effective_n_jobs(self.n_jobs), len(daily_prices))
+        bounds = np.linspace(0, len(daily_prices), n_chunks + 1).astype(int)
+        chunks = Parallel(n_jobs=self.n_jobs)(
+            delayed(_create_schedules)(self.scheduler, daily_prices[start:stop])
+            for start, stop in pairwise(bounds)
+        )
+        return [schedule_df for chunk in chunks for schedule_df in chunk]
+
+    def can_plan_ahead(self) -> bool:
+        """
+        Checks whether every day can be planned from the battery's current parameters.
+
+        A schedule only depends on the battery's capacity, initial SOC and
+        efficiencies, and of these only the efficiencies change as days are
+        applied, each time the efficiency adjuster runs. If adjusting them at the
+        battery's temperature leaves them as they are, as at 25C, they stay the same
+        for the whole simulation.
+
+        Returns:
+            bool: True if planning the days up front gives the same schedules as
+            planning each day after the previous one.
+        """
+        efficiencies = (
+            self.battery.charge_efficiency,
+            self.battery.discharge_efficiency,
+        )
+        adjusted = self.battery.efficiency_adjuster.adjust_efficiency(
+            self.battery.temperature_c, *efficiencies
+        )
+        return tuple(adjusted) == efficiencies
+
     def simulate(self) -> list:
         """
         Simulate the energy market by running daily operations and returning the results.
@@ -99,25 +158,65 @@ class EnergyMarketSimulator:
         Returns:
             list: A list of tuples containing the date, schedule DataFrame, and daily P&L for each day of the simulation.
         """
-        total_pnl = 0
-        results = []
+        n_days = (self.end_date - self.start_date).days + 1
+        results = [None] * n_days
+        daily_pnls = np.empty(n_days)
+        dates = [self.start_date + timedelta(days=day) for day in range(n_days)]
+
+        daily_prices = None
+        schedules: list = [None] * n_days
+        if self.n_jobs != 1:
+            if self.can_plan_ahead():
+                # The schedules of different days then only depend on their own
+                # prices, so they are all solved up front; the battery is still
+                # updated in order
+                daily_prices = self.price_model.get_prices_batch(dates)
+                schedules = self.create_schedules(
+                    [envelope_prices for envelope_prices, _ in daily_prices]
+                )
+            else:
+                self.logger.warning(
+                    "The battery's efficiencies change as days are applied, so the "
+                    "days are planned one by one instead of with %s jobs.",
+                    self.n_jobs,
+                )
 
         for current_day in tqdm(
-            range((self.end_date - self.start_date).days + 1),
+            range(n_days),
             desc="Processing Days",
             dynamic_ncols=True,
         ):
-            current_date = self.start_date + timedelta(days=current_day)
-            envelope_prices, noisy_prices = self.price_model.get_prices(
-                date=current_date
-            )
+            current_date = dates[current_day]
+            if daily_prices is None:
+                envelope_prices, noisy_prices = self.price_model.get_prices(
+                    date=current_date
+                )
+            else:
+                envelope_prices, noisy_prices = daily_prices[current_day]
+            schedule_df = schedules[current_day]
 
             schedule_df, daily_pnl = self.run_daily_operation(
-                envelope_prices, noisy_prices
+                envelope_prices, noisy_prices, schedule_df
             )
-            total_pnl += daily_pnl
-            results.append((current_date, schedule_df, daily_pnl))
+            daily_pnls[current_day] = daily_pnl
+            results[current_day] = (current_date, schedule_df, daily_pnl)
         self.logger.info(
-            f"Total P&L from {self.start_date} to {self.end_date}: {total_pnl}"
+            f"Total P&L from {self.start_date} to {self.end_date}: {daily_pnls.sum()}"
         )
         return results
+
+
+def _create_schedules(
+    scheduler: BatteryOptimizationScheduler, daily_prices: list
+) -> list:
+    """
+    Creates the schedules for consecutive days with one scheduler.
+
+    Args:
+        scheduler (BatteryOptimizationScheduler): The scheduler to use.
+        daily_prices (list): The envelope prices for each day.
+
+    Returns:
+        list: The schedule DataFrame for each day.
+    """
+    return [scheduler.create_schedule(prices) for prices in daily_prices]
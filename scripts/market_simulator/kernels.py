@@ -0,0 +1,31 @@
+from numba import njit
+
+
+@njit(cache=True, nogil=True)
+def daily_pnl(charge, discharge, price, charge_efficiency, discharge_efficiency):
+    """
+    Computes the P&L of a schedule in a single compiled loop.
+
+    A timestep that charges is never also counted as discharging, as in
+    `Battery.apply_schedule`.
+
+    The arrays must have the same length; numba does not check the indices.
+    fastmath is left off so that NaN prices propagate as they do in NumPy.
+
+    Args:
+        charge (numpy.ndarray): The energy charged at each timestep as a float64 array.
+        discharge (numpy.ndarray): The energy discharged at each timestep as a float64 array.
+        price (numpy.ndarray): The price at each timestep as a float64 array.
+        charge_efficiency (float): The charge efficiency of the battery.
+        discharge_efficiency (float): The discharge efficiency of the battery.
+
+    Returns:
+        float: The P&L for one hour timesteps.
+    """
+    total = 0.0
+    for i in range(price.shape[0]):
+        if charge[i] > 0:
+            total -= charge[i] * price[i] / charge_efficiency
+        elif discharge[i] > 0:
+            total += discharge[i] * price[i] * discharge_efficiency
+    return total
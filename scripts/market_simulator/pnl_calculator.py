@@ -1,7 +1,10 @@
+import numpy as np
 import pandas as pd
 
 from scripts.assets import Battery
 
+from .kernels import daily_pnl
+
 
 class PnLCalculator:
     """
@@ -30,6 +33,11 @@ class PnLCalculator:
         """
         Calculates the Profit and Loss (PnL) based on a given schedule and actual prices.
 
+        The battery's efficiencies are read when the P&L is calculated, i.e. after
+        the day's schedule has been applied to it.
+
+        Only the timesteps covered by both the schedule and the prices are counted.
+
         Args:
             schedule_df (pd.DataFrame): The schedule dataframe containing charge and discharge values.
             actual_prices (list): The list of actual prices corresponding to each timestep.
@@ -39,16 +47,15 @@ class PnLCalculator:
             float: The calculated PnL.
 
         """
-        pnl = 0
-        for i in range(len(actual_prices)):
-            charge_value = schedule_df.at[i, "Charge"]
-            discharge_value = schedule_df.at[i, "Discharge"]
-            price = actual_prices[i] * timestep_hours
-
-            if charge_value > 0:
-                pnl -= charge_value * price / self.battery.charge_efficiency
-            elif discharge_value > 0:
-                pnl += discharge_value * price * self.battery.discharge_efficiency
-            else:
-                continue  # Skip this iteration if both charge_value and discharge_value are zero
-        return pnl
+        # The schedules are too short for NumPy's per-call overhead to pay off, so
+        # the reduction runs in a single compiled loop
+        n = min(len(schedule_df), len(actual_prices))
+        price = np.asarray(actual_prices, dtype=np.float64)[:n]
+        pnl = daily_pnl(
+            schedule_df["Charge"].to_numpy(dtype=np.float64)[:n],
+            schedule_df["Discharge"].to_numpy(dtype=np.float64)[:n],
+            price,
+            self.battery.charge_efficiency,
+            self.battery.discharge_efficiency,
+        )
+        return pnl * timestep_hours
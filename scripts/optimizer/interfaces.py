@@ -33,6 +33,20 @@ class IModelBuilder(ABC):
     ) -> pyo.ConcreteModel:
         pass
 
+    def update_prices(self, model: pyo.ConcreteModel, prices: t.List[float]) -> bool:
+        """
+        Updates the prices of a model previously returned by `build_model` in place.
+
+        Args:
+            model (pyo.ConcreteModel): The model to update.
+            prices (List[float]): The new price for each time interval.
+
+        Returns:
+            bool: Whether the model was updated. Builders that cannot update a model
+            return False, and callers have to build a new one instead.
+        """
+        return False
+
 
 class IModelSolver(ABC):
     """
@@ -1,12 +1,30 @@
 import typing as t
+from abc import abstractmethod
 
 import pyomo.environ as pyo
+from pyomo.contrib.appsi.base import (
+    TerminationCondition,
+    legacy_solver_status_map,
+    legacy_termination_condition_map,
+)
+from pyomo.contrib.appsi.solvers import Highs
+from pyomo.core.expr import LinearExpression
+from pyomo.opt import SolverResults
 
 from scripts.assets import Battery
 from scripts.shared import Logger
 
 from .interfaces import IModelBuilder, IModelDefiner, IModelSolver
 
+_OPTIMAL = pyo.TerminationCondition.optimal
+_OK = pyo.SolverStatus.ok
+_TERMINATION_WARNINGS = {
+    pyo.TerminationCondition.infeasible: "Solution is infeasible. Review model constraints.",
+    pyo.TerminationCondition.infeasibleOrUnbounded: "Solution is infeasible. Review model constraints.",
+    pyo.TerminationCondition.unbounded: "Solution is unbounded. Review model objective and constraints.",
+    pyo.TerminationCondition.maxIterations: "Maximum iterations reached. Solution may not be optimal.",
+}
+
 
 class PyomoOptimizationModelBuilder(IModelBuilder, IModelDefiner):
     """A class that builds a Pyomo optimization model for battery scheduling."""
@@ -42,6 +60,21 @@ class PyomoOptimizationModelBuilder(IModelBuilder, IModelDefiner):
         self.define_constraints(model, num_intervals, max_cycles)
         return model
 
+    def update_prices(self, model: pyo.ConcreteModel, prices: t.List[float]) -> bool:
+        """
+        Update the prices of a model built by `build_model` in place.
+
+        Args:
+            model (pyo.ConcreteModel): The Pyomo optimization model.
+            prices (List[float]): The new electricity price for each time interval.
+
+        Returns:
+            bool: True, as the prices are a mutable parameter of the model.
+        """
+        self.prices = prices
+        model.price.store_values(dict(enumerate(prices)))
+        return True
+
     def define_time_intervals(self, model: pyo.ConcreteModel, num_intervals: int):
         """
         Define the time intervals for the optimization model.
@@ -82,34 +115,44 @@ class PyomoOptimizationModelBuilder(IModelBuilder, IModelDefiner):
         """
         Define the objective function rule for the optimization model.
 
+        The objective is built directly as a `LinearExpression` from precomputed
+        coefficients, which avoids growing an expression tree term by term.
+
         Args:
             model (pyo.ConcreteModel): The Pyomo optimization model.
 
         Returns:
             Expression: The expression representing the objective function.
         """
-        return sum(
-            (
-                model.discharge_vars[t]
-                * self.prices[t]
-                * self.battery.discharge_efficiency
-                / self.timestep_hours
-            )
-            - (
-                model.charge_vars[t]
-                * self.prices[t]
-                / (self.battery.charge_efficiency * self.timestep_hours)
-            )
-            for t in model.T
+        discharge_coef = self.battery.discharge_efficiency / self.timestep_hours
+        charge_coef = -1.0 / (self.battery.charge_efficiency * self.timestep_hours)
+        # The components are all indexed by model.T in order, so their values line
+        # up without looking each index up again
+        prices = list(model.price.values())
+        return LinearExpression(
+            constant=0.0,
+            linear_coefs=[price * discharge_coef for price in prices]
+            + [price * charge_coef for price in prices],
+            linear_vars=list(model.discharge_vars.values())
+            + list(model.charge_vars.values()),
         )
 
     def define_objective_function(self, model: pyo.ConcreteModel):
         """
         Define the objective function for the optimization model.
 
+        The prices enter the objective through a mutable parameter, so a built model
+        can be re-solved for new prices with `update_prices`.
+
         Args:
             model (pyo.ConcreteModel): The Pyomo optimization model.
         """
+        model.price = pyo.Param(
+            model.T,
+            mutable=True,
+            initialize=dict(enumerate(self.prices)),
+            doc="Price",
+        )
         model.objective = pyo.Objective(
             rule=self._objective_rule, sense=pyo.maximize, doc="Objective"
         )
@@ -142,16 +185,12 @@ class PyomoOptimizationModelBuilder(IModelBuilder, IModelDefiner):
         """
         if t == 0:
             return pyo.Constraint.Skip
-        else:
-            return model.soc_vars[t] == model.soc_vars[t - 1] + (
-                model.charge_vars[t - 1]
-                * self.battery.charge_efficiency
-                / self.battery.capacity_mwh
-            ) - (
-                model.discharge_vars[t - 1]
-                / self.battery.discharge_efficiency
-                / self.battery.capacity_mwh
-            )
+        return (
+            model.soc_vars[t]
+            == model.soc_vars[t - 1]
+            + self._soc_charge_coef * model.charge_vars[t - 1]
+            - self._soc_discharge_coef * model.discharge_vars[t - 1]
+        )
 
     def _energy_cycled_update_rule(self, model: pyo.ConcreteModel, t: int):
         """
@@ -166,14 +205,12 @@ class PyomoOptimizationModelBuilder(IModelBuilder, IModelDefiner):
         """
         if t == 0:
             return pyo.Constraint.Skip
-        else:
-            return model.energy_cycled_vars[t] == model.energy_cycled_vars[
-                t - 1
-            ] + model.charge_vars[
-                t - 1
-            ] * self.battery.charge_efficiency + model.discharge_vars[t - 1] * (
-                1 / self.battery.discharge_efficiency
-            )
+        return (
+            model.energy_cycled_vars[t]
+            == model.energy_cycled_vars[t - 1]
+            + self.battery.charge_efficiency * model.charge_vars[t - 1]
+            + self._cycled_discharge_coef * model.discharge_vars[t - 1]
+        )
 
     def define_constraints(
         self, model: pyo.ConcreteModel, num_intervals: int, max_cycles: float
@@ -186,6 +223,17 @@ class PyomoOptimizationModelBuilder(IModelBuilder, IModelDefiner):
             num_intervals (int): The number of time intervals.
             max_cycles (float): The maximum number of cycles allowed for the battery.
         """
+        # The rules run once per interval, so their battery-dependent coefficients
+        # are folded into plain floats up front; each variable then contributes a
+        # single term instead of a chain of product and division expressions
+        self._soc_charge_coef = (
+            self.battery.charge_efficiency / self.battery.capacity_mwh
+        )
+        self._soc_discharge_coef = 1.0 / (
+            self.battery.discharge_efficiency * self.battery.capacity_mwh
+        )
+        self._cycled_discharge_coef = 1.0 / self.battery.discharge_efficiency
+
         model.initial_soc_constraint = pyo.Constraint(
             expr=model.soc_vars[0] == self.battery.initial_soc, doc="Initial SOC"
         )
@@ -205,9 +253,11 @@ class PyomoOptimizationModelBuilder(IModelBuilder, IModelDefiner):
         )
 
 
-class GLPKOptimizationSolver(IModelSolver):
+class PyomoOptimizationSolver(IModelSolver):
     """
-    A solver implementation using the GLPK solver.
+    A base class for solvers that run through Pyomo and log the outcome of each solve.
+
+    Subclasses only implement `_solve`, which returns Pyomo's legacy results object.
 
     Args:
         log_level (int): The log level for the solver's logger. Defaults to Logger.INFO.
@@ -220,9 +270,13 @@ class GLPKOptimizationSolver(IModelSolver):
     def __init__(self, log_level: int = Logger.INFO):
         self.logger = Logger(log_level)
 
+    @abstractmethod
+    def _solve(self, model: pyo.ConcreteModel, tee: bool):
+        pass
+
     def solve(self, model: pyo.ConcreteModel, tee: bool = False):
         """
-        Solves the optimization model using the GLPK solver.
+        Solves the optimization model.
 
         Args:
             model (pyo.ConcreteModel): The optimization model to be solved.
@@ -232,29 +286,115 @@ class GLPKOptimizationSolver(IModelSolver):
             The result of the optimization solver.
 
         """
-        solver = pyo.SolverFactory("glpk")
-        result = solver.solve(model, tee=tee)
+        result = self._solve(model, tee)
 
         # Check and log the solver's termination condition and status
-        match result.solver.termination_condition:
-            case pyo.TerminationCondition.optimal if result.solver.status == pyo.SolverStatus.ok:
-                self.logger.debug("Solution is optimal.")
-            case (
-                pyo.TerminationCondition.infeasible
-                | pyo.TerminationCondition.infeasibleOrUnbounded
-            ):
-                self.logger.warning("Solution is infeasible. Review model constraints.")
-            case pyo.TerminationCondition.unbounded:
-                self.logger.warning(
-                    "Solution is unbounded. Review model objective and constraints."
-                )
-            case pyo.TerminationCondition.maxIterations:
-                self.logger.warning(
-                    "Maximum iterations reached. Solution may not be optimal."
-                )
-            case _:
-                self.logger.error(
-                    f"Unexpected solver status encountered: {result.solver.status}, {result.solver.termination_condition}"
-                )
+        status = result.solver.status
+        termination_condition = result.solver.termination_condition
+        if termination_condition == _OPTIMAL and status == _OK:
+            self.logger.debug("Solution is optimal.")
+        elif termination_condition in _TERMINATION_WARNINGS:
+            self.logger.warning(_TERMINATION_WARNINGS[termination_condition])
+        else:
+            self.logger.error(
+                f"Unexpected solver status encountered: {status}, {termination_condition}"
+            )
 
         return result
+
+
+class GLPKOptimizationSolver(PyomoOptimizationSolver):
+    """
+    A solver implementation using the GLPK solver.
+
+    Args:
+        log_level (int): The log level for the solver's logger. Defaults to Logger.INFO.
+
+    Attributes:
+        logger (Logger): The logger instance for logging solver information.
+
+    """
+
+    def _solve(self, model: pyo.ConcreteModel, tee: bool):
+        solver = pyo.SolverFactory("glpk")
+        return solver.solve(model, tee=tee)
+
+
+class HighsOptimizationSolver(PyomoOptimizationSolver):
+    """
+    A solver implementation using HiGHS through Pyomo's persistent appsi interface.
+
+    HiGHS solves these LPs considerably faster than GLPK, and the appsi interface
+    hands the model over in memory rather than through an LP file. The solver
+    instance is kept between solves, so re-solving the same model, as
+    `BatteryOptimizationScheduler` does when only the prices change, only passes
+    the changes on to HiGHS, which then starts from the previous basis.
+
+    Args:
+        log_level (int): The log level for the solver's logger. Defaults to Logger.INFO.
+        params_only (bool): Whether a model that is solved again has only had its
+            mutable parameters changed, as with `BatteryOptimizationScheduler`. This
+            skips appsi's scan for added, removed or modified variables, constraints
+            and objectives before each re-solve. Defaults to False.
+
+    Attributes:
+        logger (Logger): The logger instance for logging solver information.
+
+    """
+
+    def __init__(self, log_level: int = Logger.INFO, params_only: bool = False):
+        super().__init__(log_level)
+        self.params_only = params_only
+        self._solver: Highs | None = None
+
+    @staticmethod
+    def available() -> bool:
+        """
+        Checks whether HiGHS can be used, i.e. whether `highspy` is installed.
+
+        Returns:
+            bool: True if the solver is available.
+        """
+        return bool(Highs().available())
+
+    def _create_solver(self) -> Highs:
+        solver = Highs()
+        # appsi raises when asked to load a solution that does not exist, so the
+        # solution is only loaded once the solve is known to be optimal
+        solver.config.load_solution = False
+        if self.params_only:
+            update_config = solver.update_config
+            update_config.check_for_new_or_removed_constraints = False
+            update_config.check_for_new_or_removed_vars = False
+            update_config.check_for_new_or_removed_params = False
+            update_config.check_for_new_objective = False
+            update_config.update_constraints = False
+            update_config.update_vars = False
+            update_config.update_named_expressions = False
+            update_config.update_objective = False
+        return solver
+
+    def _solve(self, model: pyo.ConcreteModel, tee: bool):
+        solver = self._solver
+        if solver is None:
+            solver = self._solver = self._create_solver()
+        solver.config.stream_solver = tee
+        results = solver.solve(model)
+        if results.termination_condition == TerminationCondition.optimal:
+            results.solution_loader.load_vars()
+
+        # The appsi results are translated directly rather than through the legacy
+        # SolverFactory wrapper, which labels every variable on each solve
+        result = SolverResults()
+        result.solver.status = legacy_solver_status_map[results.termination_condition]
+        result.solver.termination_condition = legacy_termination_condition_map[
+            results.termination_condition
+        ]
+        return result
+
+    def __getstate__(self):
+        # The HiGHS instance cannot be pickled, e.g. into a joblib worker; each
+        # copy creates its own on first use
+        state = self.__dict__.copy()
+        state["_solver"] = None
+        return state
@@ -1,5 +1,7 @@
 import typing as t
+from itertools import islice
 
+import numpy as np
 import pandas as pd
 import pyomo.environ as pyo
 
@@ -35,16 +37,24 @@ class PyomoModelExtractor(IModelExtractor):
             pd.DataFrame: A DataFrame containing the extracted schedule data.
 
         """
-        schedule_data = [
+        # The variables are indexed 0..num_intervals - 1 in order, so their values
+        # can be read straight off the components into one array per column
+        return pd.DataFrame(
             {
-                "Interval": i,
-                "Charge": pyo.value(model.charge_vars[i]),
-                "Discharge": pyo.value(model.discharge_vars[i]),
-                "SOC": pyo.value(model.soc_vars[i]),
+                "Interval": np.arange(num_intervals),
+                "Charge": self._values(model.charge_vars, num_intervals),
+                "Discharge": self._values(model.discharge_vars, num_intervals),
+                "SOC": self._values(model.soc_vars, num_intervals),
             }
-            for i in range(num_intervals)
-        ]
-        return pd.DataFrame(schedule_data)
+        )
+
+    @staticmethod
+    def _values(var: pyo.Var, num_intervals: int) -> np.ndarray:
+        return np.fromiter(
+            (v.value for v in islice(var.values(), num_intervals)),
+            dtype=np.float64,
+            count=num_intervals,
+        )
 
 
 class BatteryOptimizationScheduler(IScheduler):
@@ -73,6 +83,8 @@ class BatteryOptimizationScheduler(IScheduler):
         self.model_builder = model_builder
         self.solver = solver
         self.model_extractor = model_extractor
+        self._model: pyo.ConcreteModel | None = None
+        self._model_key: t.Tuple[t.Any, ...] | None = None
 
     def create_schedule(
         self,
@@ -99,13 +111,32 @@ class BatteryOptimizationScheduler(IScheduler):
         """
         num_intervals = len(prices)
 
-        model = self.model_builder.build_model(
-            num_intervals=num_intervals,
-            prices=prices,
-            battery=self.battery,
-            timestep_hours=timestep_hours,
-            max_cycles=max_cycles,
+        # Only the prices change from day to day, so the model is rebuilt only when
+        # anything else it was built from has changed
+        model_key = (
+            num_intervals,
+            timestep_hours,
+            max_cycles,
+            self.battery.capacity_mwh,
+            self.battery.charge_efficiency,
+            self.battery.discharge_efficiency,
+            self.battery.initial_soc,
         )
+        if (
+            self._model is not None
+            and self._model_key == model_key
+            and self.model_builder.update_prices(self._model, prices)
+        ):
+            model = self._model
+        else:
+            model = self.model_builder.build_model(
+                num_intervals=num_intervals,
+                prices=prices,
+                battery=self.battery,
+                timestep_hours=timestep_hours,
+                max_cycles=max_cycles,
+            )
+            self._model, self._model_key = model, model_key
         result = self.solver.solve(model, tee)
 
         if (
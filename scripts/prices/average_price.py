@@ -1,6 +1,7 @@
 import datetime
 import typing as t
 
+import numpy as np
 import pandas as pd
 
 from scripts.prices.price_data_helper import PriceDataHelper
@@ -21,6 +22,7 @@ class HistoricalAveragePriceModel(IPriceData):
     DAYS_IN_WEEK = 7
     PRICE_COLUMN = "GB_GBN_price_day_ahead"
     TIMESTAMP_COLUMN = "utc_timestamp"
+    HOUR_COLUMN = "hour"
 
     def __init__(
         self,
@@ -30,13 +32,20 @@ class HistoricalAveragePriceModel(IPriceData):
     ):
         self.data_provider = data_provider
         self.interpolate = interpolate
+        # Sorted so that the days can be looked up by searching the index, with
+        # the hour of each row ready to group by
         self.data = self.data_provider.get_data(
             column_names=[self.PRICE_COLUMN], timestamp_column=self.TIMESTAMP_COLUMN
-        )
+        ).sort_index()
+        self.data[self.HOUR_COLUMN] = self.data.index.hour
         self.helper = PriceDataHelper()
         self.prior_days = prior_days
         if self.interpolate:
-            self.data[self.PRICE_COLUMN].interpolate(method="linear", inplace=True)
+            self.data[self.PRICE_COLUMN] = self.helper.interpolate(
+                self.data[self.PRICE_COLUMN]
+            )
+        self._average_prices = self._get_average_prices_table()
+        self._daily_prices = self._get_daily_prices_table()
 
     def get_prices(self, date: datetime.date) -> t.Tuple[t.List[float], t.List[float]]:
         """
@@ -50,15 +59,22 @@ class HistoricalAveragePriceModel(IPriceData):
             and the prices for the current date.
         """
         current_date = self.helper.get_current_date(date)
-        prior_date = self.helper.get_prior_date(current_date, self.DAYS_IN_WEEK)
-
-        prior_data = self.helper.get_prior_data(current_date, prior_date, self.data)
-        average_prices_last_week = self.get_average_prices_last_week(prior_data)
-
-        current_date_data = self.helper.get_current_date_data(current_date, self.data)
-        prices_current_date = self.helper.get_prices_current_date(
-            current_date_data, self.PRICE_COLUMN
-        )
+        if current_date in self._average_prices:
+            average_prices_last_week = list(self._average_prices[current_date])
+        else:
+            prior_date = self.helper.get_prior_date(current_date, self.DAYS_IN_WEEK)
+            prior_data = self.helper.get_prior_data(current_date, prior_date, self.data)
+            average_prices_last_week = self.get_average_prices_last_week(prior_data)
+
+        if current_date in self._daily_prices:
+            prices_current_date = list(self._daily_prices[current_date])
+        else:
+            current_date_data = self.helper.get_current_date_data(
+                current_date, self.data
+            )
+            prices_current_date = self.helper.get_prices_current_date(
+                current_date_data, self.PRICE_COLUMN
+            )
 
         return average_prices_last_week, prices_current_date
 
@@ -76,8 +92,80 @@ class HistoricalAveragePriceModel(IPriceData):
         """
         assert isinstance(last_week_data.index, pd.DatetimeIndex)
 
-        return (
-            last_week_data.groupby(last_week_data.index.hour)[self.PRICE_COLUMN]
-            .mean()
-            .tolist()
+        # Averaged per hour with bincount like a groupby mean would: missing
+        # prices are skipped, and hours without any rows are left out
+        hours = last_week_data[self.HOUR_COLUMN].to_numpy()
+        prices = last_week_data[self.PRICE_COLUMN].to_numpy()
+        known = ~np.isnan(prices)
+
+        sums = np.bincount(hours[known], weights=prices[known], minlength=24)
+        counts = np.bincount(hours[known], minlength=24)
+        with np.errstate(invalid="ignore"):
+            averages = np.where(counts > 0, sums / counts, np.nan)
+
+        return averages[np.bincount(hours, minlength=24) > 0].tolist()
+
+    def _get_average_prices_table(self) -> t.Dict[datetime.datetime, t.List[float]]:
+        """
+        Calculate the average prices of the week before every day of the data.
+
+        The prices are summed and counted per day and hour, and both are rolled
+        over the prior days, so the averages of a day are the same as grouping
+        the rows of the week before it by hour.
+
+        Returns:
+            Dict[datetime.datetime, List[float]]: The average prices for each
+            hour with rows in the week before a day, from the first day of the
+            data up to the day after the last one.
+        """
+        prices = self.data[self.PRICE_COLUMN]
+        if prices.empty:
+            return {}
+
+        grouped = prices.groupby([prices.index.floor("D"), self.data[self.HOUR_COLUMN]])
+        days = pd.date_range(
+            prices.index[0].floor("D"),
+            prices.index[-1].floor("D") + pd.Timedelta(days=1),
+            freq="D",
         )
+
+        # Every calendar day has a row, so rolling over rows rolls over days
+        sums, counts, rows = (
+            aggregate.unstack(fill_value=0)
+            .reindex(days, fill_value=0)
+            .rolling(self.DAYS_IN_WEEK, min_periods=1)
+            .sum()
+            .shift(1, fill_value=0)
+            .to_numpy()
+            for aggregate in (grouped.sum(), grouped.count(), grouped.size())
+        )
+        with np.errstate(invalid="ignore"):
+            averages = np.where(counts > 0, sums / counts, np.nan)
+
+        return {
+            day: averages[i, rows[i] > 0].tolist()
+            for i, day in enumerate(days.to_pydatetime())
+        }
+
+    def _get_daily_prices_table(self) -> t.Dict[datetime.datetime, t.List[float]]:
+        """
+        Split the prices into the prices of each day of the data.
+
+        Returns:
+            Dict[datetime.datetime, List[float]]: The prices of each day with
+            rows, in the order of their timestamps.
+        """
+        prices = self.data[self.PRICE_COLUMN]
+        if prices.empty:
+            return {}
+
+        # The data is sorted, so each day is a run of rows starting where the day
+        # of the timestamp changes
+        days = prices.index.floor("D")
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        return {
+            day: day_prices.tolist()
+            for day, day_prices in zip(
+                days[starts].to_pydatetime(), np.split(prices.to_numpy(), starts[1:])
+            )
+        }
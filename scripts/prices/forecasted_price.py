@@ -1,7 +1,7 @@
 import datetime
 import typing as t
-import warnings
 
+import numpy as np
 import pandas as pd
 
 from scripts.forecast.ts_forecast import (
@@ -16,8 +16,6 @@ from scripts.shared.interfaces import IDataProvider
 
 from .interfaces import IPriceData
 
-warnings.simplefilter(action="ignore", category=pd.errors.SettingWithCopyWarning)
-
 
 class ForecastPriceModel(IPriceData, IForecaster):
     """
@@ -38,6 +36,9 @@ class ForecastPriceModel(IPriceData, IForecaster):
         history_length (int, optional): The length of the historical data used for training. Defaults to 7 * 24.
         forecast_length (int, optional): The length of the forecasted data. Defaults to 24.
         interpolate (bool, optional): Whether to interpolate missing values in the price data. Defaults to True.
+        prior_days (int, optional): The number of days before a date that its forecast is made from. Defaults to 7.
+        window_days (int, optional): If set, only the data of this many days before the last timestamp is kept
+            after loading, for forecasting the next days without holding the whole history. Defaults to None.
     """
 
     DAYS_IN_WEEK = 7
@@ -53,6 +54,7 @@ class ForecastPriceModel(IPriceData, IForecaster):
         forecast_length=24,
         interpolate: bool = True,
         prior_days: int = DAYS_IN_WEEK,
+        window_days: int | None = None,
     ):
         self.data_provider = data_provider
         self.interpolate = interpolate
@@ -62,12 +64,29 @@ class ForecastPriceModel(IPriceData, IForecaster):
         self.forecaster = TimeSeriesForecaster(model, data_preprocessor)
         self.data = self.data_provider.get_data(
             column_names=[self.PRICE_COLUMN], timestamp_column=self.TIMESTAMP_COLUMN
-        )
+        ).sort_index()
         self.helper = PriceDataHelper()
         self._prior_days = prior_days
 
         if self.interpolate:
-            self.data[self.PRICE_COLUMN].interpolate(method="linear", inplace=True)
+            self.data[self.PRICE_COLUMN] = self.helper.interpolate(
+                self.data[self.PRICE_COLUMN]
+            )
+        # Trimmed after interpolating so the kept prices are filled the same way,
+        # and copied so the rest of the history can be freed
+        if window_days is not None and not self.data.empty:
+            cutoff = self.data.index[-1] - pd.Timedelta(days=window_days)
+            self.data = self.data.loc[cutoff.floor("D") :].copy()
+        # The actual prices of a day are read straight from these arrays, which
+        # skips building a DataFrame slice per call
+        self._prices = self.data[self.PRICE_COLUMN].to_numpy()
+        self._timestamps = self.data.index.asi8
+        self._day_rows = self._get_day_rows_table()
+        # The prices of each date already requested; the data does not change
+        # after loading, so they only go stale when the model is retrained
+        self._prices_cache: t.Dict[
+            datetime.datetime, t.Tuple[t.List[float], t.List[float]]
+        ] = {}
 
     def get_prices(self, date: datetime.date) -> t.Tuple[t.List[float], t.List[float]]:
         """
@@ -80,18 +99,124 @@ class ForecastPriceModel(IPriceData, IForecaster):
             Tuple[List[float], List[float]]: A tuple containing the forecasted prices and actual prices.
         """
         current_date = self.helper.get_current_date(date)
-        prior_date = self.helper.get_prior_date(current_date, self._prior_days)
+        cached = self._prices_cache.get(current_date)
+        if cached is not None:
+            return list(cached[0]), list(cached[1])
 
-        prior_data = self.helper.get_prior_data(current_date, prior_date, self.data)
-        forecasted_prices = self.forecast(prior_data)
+        forecasted_prices = self.forecast(self._get_prior_data(current_date))
 
-        current_date_data = self.helper.get_current_date_data(current_date, self.data)
-        prices_current_date = self.helper.get_prices_current_date(
-            current_date_data, self.PRICE_COLUMN
+        prices_current_date = self._get_prices_between(
+            current_date, current_date + datetime.timedelta(days=1)
         )
 
+        self._prices_cache[current_date] = (
+            list(forecasted_prices),
+            list(prices_current_date),
+        )
         return forecasted_prices, prices_current_date
 
+    def get_prices_batch(
+        self, dates: t.List[datetime.date]
+    ) -> t.List[t.Tuple[t.List[float], t.List[float]]]:
+        """
+        Get the forecasted prices and actual prices for several dates.
+
+        The dates that are not cached yet are forecast together, with a single call
+        to the model.
+
+        Args:
+            dates (List[datetime.date]): The dates for which to get the prices.
+
+        Returns:
+            List[Tuple[List[float], List[float]]]: The forecasted prices and actual
+            prices of each date.
+        """
+        current_dates = [self.helper.get_current_date(date) for date in dates]
+        missing = [
+            current_date
+            for current_date in dict.fromkeys(current_dates)
+            if current_date not in self._prices_cache
+        ]
+        forecasts = self.forecaster.forecast_many(
+            [self._get_prior_data(current_date) for current_date in missing],
+            column_name=self.PRICE_COLUMN,
+            include_lead=False,
+        )
+        for current_date, forecast in zip(missing, forecasts):
+            self._prices_cache[current_date] = (
+                forecast.flatten().tolist(),
+                self._get_prices_between(
+                    current_date, current_date + datetime.timedelta(days=1)
+                ),
+            )
+
+        return [
+            (list(forecasted_prices), list(prices_current_date))
+            for forecasted_prices, prices_current_date in map(
+                self._prices_cache.__getitem__, current_dates
+            )
+        ]
+
+    def _get_day_rows_table(self) -> t.Dict[datetime.datetime, int]:
+        """
+        Find the first row of each day of the data.
+
+        Returns:
+            Dict[datetime.datetime, int]: The position of the first row of each
+            day with rows.
+        """
+        if self.data.empty:
+            return {}
+
+        # The data is sorted, so each day starts where the day of the timestamp
+        # changes
+        days = self.data.index.floor("D")
+        starts = np.flatnonzero(np.r_[True, days[1:] != days[:-1]])
+        return dict(zip(days[starts].to_pydatetime(), starts.tolist()))
+
+    def _get_row(self, timestamp: datetime.datetime) -> int:
+        """
+        Get the position of the first row at or after a timestamp.
+
+        Args:
+            timestamp (datetime.datetime): The timestamp to look up.
+
+        Returns:
+            int: The position of the row.
+        """
+        row = self._day_rows.get(timestamp)
+        if row is None:
+            row = int(np.searchsorted(self._timestamps, pd.Timestamp(timestamp).value))
+        return row
+
+    def _get_prior_data(self, current_date: datetime.datetime) -> pd.DataFrame:
+        """
+        Get the data of the days before a date that the forecast is made from.
+
+        Args:
+            current_date (datetime.datetime): The date to forecast.
+
+        Returns:
+            pd.DataFrame: The data from the prior date up to the current date.
+        """
+        prior_date = self.helper.get_prior_date(current_date, self._prior_days)
+        return self.data.iloc[self._get_row(prior_date) : self._get_row(current_date)]
+
+    def _get_prices_between(
+        self, start: datetime.datetime, end: datetime.datetime
+    ) -> t.List[float]:
+        """
+        Get the prices with a timestamp from start up to, but excluding, end.
+
+        Args:
+            start (datetime.datetime): The first timestamp to include.
+            end (datetime.datetime): The timestamp to stop at.
+
+        Returns:
+            List[float]: The prices between the two timestamps.
+        """
+        return self._prices[self._get_row(start) : self._get_row(end)].tolist()
+
     def train(self, df):
         """
         Train the forecast price model.
@@ -100,6 +225,7 @@ class ForecastPriceModel(IPriceData, IForecaster):
             df (pandas.DataFrame): The training data.
         """
         self.forecaster.train(df, column_name=self.PRICE_COLUMN, include_lead=True)
+        self._prices_cache.clear()
 
     def forecast(self, df):
         """
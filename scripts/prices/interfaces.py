@@ -22,6 +22,23 @@ class IPriceData(ABC):
         """
         pass
 
+    def get_prices_batch(
+        self, dates: t.List[datetime.date]
+    ) -> t.List[t.Tuple[t.List[float], t.List[float]]]:
+        """Get the prices for several dates.
+
+        Models that can produce the prices of many dates at once more cheaply than
+        one by one override this; by default it calls `get_prices` for each date.
+
+        Args:
+            dates (List[datetime.date]): The dates for which to retrieve the prices.
+
+        Returns:
+            List[Tuple[List[float], List[float]]]: The prices of each date, as
+                returned by `get_prices`.
+        """
+        return [self.get_prices(date=date) for date in dates]
+
 
 class IPriceEnvelopeGenerator(ABC):
     """
@@ -120,3 +137,15 @@ class IPriceDataHelper(ABC):
             List[float]: The prices for the current date.
         """
         pass
+
+    @abstractmethod
+    def interpolate(self, prices: pd.Series) -> pd.Series:
+        """Fill the missing prices by linear interpolation.
+
+        Args:
+            prices (pd.Series): The prices, in timestamp order.
+
+        Returns:
+            pd.Series: The prices with the missing values filled.
+        """
+        pass
@@ -1,11 +1,13 @@
 import datetime
 import typing as t
 
+import numpy as np
 import pandas as pd
-import pytz  # type: ignore
 
 from .interfaces import IPriceDataHelper
 
+_UTC = datetime.timezone.utc  # noqa: UP017
+
 
 class PriceDataHelper(IPriceDataHelper):
     """Helper class for manipulating price data."""
@@ -19,9 +21,7 @@ class PriceDataHelper(IPriceDataHelper):
         Returns:
             datetime.datetime: The current date as a datetime object in UTC.
         """
-        return datetime.datetime.combine(date, datetime.time.min).replace(
-            tzinfo=pytz.utc
-        )
+        return datetime.datetime.combine(date, datetime.time.min, tzinfo=_UTC)
 
     def get_prior_date(
         self, current_date: datetime.datetime, delta_days: int
@@ -34,7 +34,7 @@ class PriceDataHelper(IPriceDataHelper):
         prior_date: datetime.datetime,
         data: pd.DataFrame,
     ) -> pd.DataFrame:
-        return data[(data.index >= prior_date) & (data.index < current_date)]
+        return self._get_data_between(prior_date, current_date, data)
 
     def get_current_date_data(
         self, current_date: datetime.datetime, data: pd.DataFrame
@@ -50,11 +50,9 @@ class PriceDataHelper(IPriceDataHelper):
         """
         assert isinstance(data.index, pd.DatetimeIndex)
 
-        current_date_data = data[
-            (data.index.year == current_date.year)
-            & (data.index.month == current_date.month)
-            & (data.index.day == current_date.day)
-        ]
+        current_date_data = self._get_data_between(
+            current_date, current_date + datetime.timedelta(days=1), data
+        )
         assert isinstance(current_date_data, pd.DataFrame)
         return current_date_data
 
@@ -70,6 +68,49 @@ class PriceDataHelper(IPriceDataHelper):
         Returns:
             List[float]: The prices for the current date.
         """
-        prices_current_date = list(current_date_data[column_name].values)
-        assert isinstance(prices_current_date, list)
-        return prices_current_date
+        # tolist converts in C and gives Python floats, like the models' tables
+        return current_date_data[column_name].to_numpy(dtype=np.float64).tolist()
+
+    def interpolate(self, prices: pd.Series) -> pd.Series:
+        """Fill the missing prices by linear interpolation.
+
+        Gives the same result as `Series.interpolate(method="linear")`: the rows
+        are treated as evenly spaced, missing prices before the first known one
+        are left missing and those after the last known one repeat it. The gaps
+        are filled with a single `np.interp` call instead.
+
+        Args:
+            prices (pd.Series): The prices, in timestamp order.
+
+        Returns:
+            pd.Series: The prices with the missing values filled.
+        """
+        values = prices.to_numpy(dtype=np.float64, copy=True)
+        missing = np.isnan(values)
+        known = np.flatnonzero(~missing)
+        if len(known):
+            gaps = np.flatnonzero(missing)
+            gaps = gaps[gaps > known[0]]
+            values[gaps] = np.interp(gaps, known, values[known])
+        return pd.Series(values, index=prices.index, name=prices.name)
+
+    @staticmethod
+    def _get_data_between(
+        start: datetime.datetime, end: datetime.datetime, data: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Get the data with a timestamp from start up to, but excluding, end.
+
+        A sorted index is searched for the bounds instead of being compared
+        row by row against them.
+
+        Args:
+            start (datetime.datetime): The first timestamp to include.
+            end (datetime.datetime): The timestamp to stop at.
+            data (pd.DataFrame): The data to filter.
+
+        Returns:
+            pd.DataFrame: The data between the two timestamps.
+        """
+        if not data.index.is_monotonic_increasing:
+            return data[(data.index >= start) & (data.index < end)]
+        return data.iloc[data.index.searchsorted(start) : data.index.searchsorted(end)]
@@ -1,8 +1,9 @@
 import datetime
-import math
-import random
 import typing as t
 
+import numpy as np
+from numba import njit
+
 from .interfaces import IPriceData, IPriceEnvelopeGenerator, IPriceNoiseAdder
 
 
@@ -32,6 +33,17 @@ class SimulatedPriceEnvelopeGenerator(IPriceEnvelopeGenerator):
         self.peak_start = peak_start
         self.peak_end = peak_end
 
+        # The sine envelope only depends on the parameters above, so it is
+        # computed once and each date just adds its random adjustment to it
+        i = np.arange(num_intervals)
+        x = (np.pi * 2) * (i / num_intervals)
+        price_range = max_price - min_price
+
+        peak = min_price + price_range * (np.sin(x - np.pi / 2) + 1) / 2
+        off_peak = min_price + price_range / 4 * (np.sin(x * 2 - np.pi / 2) + 1) / 2
+        self._base_prices = np.where((i >= peak_start) & (i < peak_end), peak, off_peak)
+        self._adjustment_scale = price_range / 20
+
     def generate(self, date: datetime.date) -> t.List[float]:
         """
         Generates a simulated price envelope for the given date.
@@ -42,28 +54,40 @@ class SimulatedPriceEnvelopeGenerator(IPriceEnvelopeGenerator):
         Returns:
             List[float]: A list of price values representing the price envelope.
         """
-        random.seed(date.toordinal())
-        prices = []
-        for i in range(self.num_intervals):
-            x = (math.pi * 2) * (i / self.num_intervals)
-
-            if self.peak_start <= i < self.peak_end:
-                sine_value = (math.sin(x - math.pi / 2) + 1) / 2
-                price = self.min_price + (self.max_price - self.min_price) * sine_value
-            else:
-                off_peak_amplitude = (self.max_price - self.min_price) / 4
-                sine_value = (math.sin(x * 2 - math.pi / 2) + 1) / 2
-                price = self.min_price + off_peak_amplitude * sine_value
+        # Seeded with the date so that the envelope of a day is always the same
+        return _adjust_envelope(
+            date.toordinal(),
+            self._base_prices,
+            self._adjustment_scale,
+            self.min_price,
+            self.max_price,
+        ).tolist()
+
+
+@njit(cache=True, nogil=True)
+def _adjust_envelope(seed, base_prices, scale, min_price, max_price):
+    """
+    Adds a seeded random adjustment to each price of an envelope.
 
-            random_adjustment = (
-                random.uniform(-1, 1) * (self.max_price - self.min_price) / 20
-            )
-            price += random_adjustment
-            price = float(max(self.min_price, min(price, self.max_price)))
+    Seeding numba's own generator costs far less than creating a numpy
+    Generator for every date, which otherwise dominates a 24-interval call.
 
-            prices.append(price)
+    Args:
+        seed (int): The seed of the adjustments.
+        base_prices (numpy.ndarray): The envelope to adjust.
+        scale (float): The largest adjustment in either direction.
+        min_price (float): The lowest price to clip to.
+        max_price (float): The highest price to clip to.
 
-        return prices
+    Returns:
+        numpy.ndarray: The adjusted prices.
+    """
+    np.random.seed(seed)
+    prices = np.empty_like(base_prices)
+    for i in range(base_prices.shape[0]):
+        price = base_prices[i] + np.random.uniform(-1.0, 1.0) * scale
+        prices[i] = min(max(price, min_price), max_price)
+    return prices
 
 
 class SimulatedPriceNoiseAdder(IPriceNoiseAdder):
@@ -74,6 +98,7 @@ class SimulatedPriceNoiseAdder(IPriceNoiseAdder):
         noise_level (float): The maximum amount of noise to add to each price.
         spike_chance (float): The probability of a price spike occurring.
         spike_multiplier (float): The multiplier applied to prices when a spike occurs.
+        seed (int, optional): The seed of the random number generator, for reproducible noise.
     """
 
     def __init__(
@@ -81,10 +106,13 @@ class SimulatedPriceNoiseAdder(IPriceNoiseAdder):
         noise_level: float = 5.0,
         spike_chance: float = 0.05,
         spike_multiplier: float = 1.5,
+        seed: int | None = None,
     ):
         self.noise_level = noise_level
         self.spike_chance = spike_chance
         self.spike_multiplier = spike_multiplier
+        self.seed = seed
+        self._rng = np.random.default_rng(seed)
 
     def add(self, prices: t.List[float]) -> t.List[float]:
         """
@@ -96,18 +124,16 @@ class SimulatedPriceNoiseAdder(IPriceNoiseAdder):
         Returns:
             List[float]: The list of prices with simulated noise added.
         """
-        noisy_prices = []
-        for price in prices:
-            noise = random.uniform(-self.noise_level, self.noise_level)
-            new_price = price + noise
-
-            if random.random() < self.spike_chance:
-                new_price *= self.spike_multiplier
+        noisy_prices = np.array(prices, dtype=np.float64)
+        noisy_prices += self._rng.uniform(
+            -self.noise_level, self.noise_level, len(prices)
+        )
 
-            new_price = float(max(0, new_price))
-            noisy_prices.append(new_price)
+        spikes = self._rng.random(len(prices)) < self.spike_chance
+        np.multiply(noisy_prices, self.spike_multiplier, out=noisy_prices, where=spikes)
+        np.maximum(noisy_prices, 0, out=noisy_prices)
 
-        return noisy_prices
+        return noisy_prices.tolist()
 
 
 class SimulatedPriceModel(IPriceData):
@@ -1,3 +1,6 @@
+import os
+from functools import lru_cache
+
 import pandas as pd
 
 from .interfaces import IDataProvider
@@ -28,16 +31,40 @@ class CSVDataProvider(IDataProvider):
 
         Args:
             column_names (list): A list of column names to include in the DataFrame.
+                A single column name is treated as a list of one.
             timestamp_column (str): The name of the column to use as the index.
 
         Returns:
             pd.DataFrame: A DataFrame containing the specified columns from the CSV file.
 
         """
-        df = pd.read_csv(
-            self.csv_file_path,
-            parse_dates=[timestamp_column],
+        if isinstance(column_names, str):
+            column_names = [column_names]
+        # Models built from the same file share one parse; each gets its own copy
+        # since they add columns to and fill the data they are given
+        file_stat = os.stat(self.csv_file_path)
+        df = _read_csv_cached(
+            os.path.realpath(self.csv_file_path),
+            file_stat.st_mtime_ns,
+            file_stat.st_size,
+            tuple(column_names),
+            timestamp_column,
         )
-        df = df.set_index(timestamp_column)
-        df.index.name = None
-        return df[column_names]
+        return df.copy()
+
+
+@lru_cache(maxsize=4)
+def _read_csv_cached(file_path, mtime_ns, size, column_names, timestamp_column):
+    # mtime_ns and size are only part of the cache key, so rewriting the file
+    # reads it again. Only the needed columns are read, and the pyarrow engine
+    # parses the ISO timestamps itself, much faster than parse_dates does
+    df = pd.read_csv(
+        file_path,
+        usecols=[timestamp_column, *column_names],
+        engine="pyarrow",
+    )
+    timestamps = pd.to_datetime(df[timestamp_column])
+    df[timestamp_column] = timestamps.dt.as_unit("ns")
+    df = df.set_index(timestamp_column)
+    df.index.name = None
+    return df[list(column_names)]
@@ -14,11 +14,11 @@ class Logger:
 
     Methods:
         __init__(self, level=INFO): Initializes the logger with the specified log level.
-        debug(self, msg): Logs a debug message.
-        info(self, msg): Logs an informational message.
-        warning(self, msg): Logs a warning message.
-        error(self, msg): Logs an error message.
-        critical(self, msg): Logs a critical message.
+        debug(self, msg, *args): Logs a debug message.
+        info(self, msg, *args): Logs an informational message.
+        warning(self, msg, *args): Logs a warning message.
+        error(self, msg, *args): Logs an error message.
+        critical(self, msg, *args): Logs a critical message.
     """
 
     DEBUG = logging.DEBUG
@@ -44,47 +44,52 @@ class Logger:
 
             self.logger.addHandler(handler)
 
-    def debug(self, msg):
+    def debug(self, msg, *args):
         """
         Logs a debug message.
 
         Args:
             msg (str): The message to log.
+            *args: Arguments merged into the message printf-style, only if it is emitted.
         """
-        self.logger.debug(msg)
+        self.logger.debug(msg, *args)
 
-    def info(self, msg):
+    def info(self, msg, *args):
         """
         Logs an informational message.
 
         Args:
             msg (str): The message to log.
+            *args: Arguments merged into the message printf-style, only if it is emitted.
         """
-        self.logger.info(msg)
+        self.logger.info(msg, *args)
 
-    def warning(self, msg):
+    def warning(self, msg, *args):
         """
         Logs a warning message.
 
         Args:
             msg (str): The message to log.
+            *args: Arguments merged into the message printf-style, only if it is emitted.
         """
-        self.logger.warning(msg)
+        self.logger.warning(msg, *args)
 
-    def error(self, msg):
+    def error(self, msg, *args):
         """
         Logs an error message.
 
         Args:
             msg (str): The message to log.
+            *args: Arguments merged into the message printf-style, only if it is emitted.
         """
-        self.logger.error(msg)
+        self.logger.error(msg, *args)
 
-    def critical(self, msg):
+    def critical(self, msg, *args):
         """
         Logs a critical message.
 
         Args:
             msg (str): The message to log.
+            *args: Arguments merged into the message printf-style, only if it is emitted.
         """
-        self.logger.critical(msg)
+        self.logger.critical(msg, *args)
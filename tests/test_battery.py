@@ -133,5 +133,24 @@ def test_battery_check_and_update_cycles_with_high_energy_cycled():
     assert battery.energy_cycled_mwh == 2.0
 
 
+def test_battery_apply_schedule_matches_stepwise():
+    charge = [0.5, 0.0, 0.0, 0.2]
+    discharge = [0.0, 0.3, 0.0, 0.1]
+
+    battery = Battery(1.0, temperature_c=30)
+    battery.apply_schedule(charge, discharge)
+
+    expected = Battery(1.0, temperature_c=30)
+    expected.charge(0.5)
+    expected.discharge(0.3)
+    expected.charge(0.0)
+    expected.charge(0.2)
+
+    assert battery.soc == expected.soc
+    assert battery.soh == expected.soh
+    assert battery.energy_cycled_mwh == expected.energy_cycled_mwh
+    assert battery.cycle_count == expected.cycle_count
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
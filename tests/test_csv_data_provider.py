@@ -32,5 +32,32 @@ def test_csv_data_provider(create_test_csv):
     assert_frame_equal(data, expected_data)
 
 
+def test_csv_data_provider_rereads_rewritten_file(tmp_path):
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text("utc_timestamp,price\n2022-01-01T00:00:00Z,1.0\n")
+    first = CSVDataProvider(str(csv_path)).get_data(["price"], "utc_timestamp")
+    first["price"] = 5.0
+
+    assert CSVDataProvider(str(csv_path)).get_data(["price"], "utc_timestamp")[
+        "price"
+    ].tolist() == [1.0]
+
+    csv_path.write_text("utc_timestamp,price\n2022-01-01T00:00:00Z,2.0\n")
+    assert CSVDataProvider(str(csv_path)).get_data(["price"], "utc_timestamp")[
+        "price"
+    ].tolist() == [2.0]
+
+
+def test_csv_data_provider_single_column_name(tmp_path):
+    csv_path = tmp_path / "prices.csv"
+    csv_path.write_text("utc_timestamp,price,volume\n2022-01-01T00:00:00Z,1.0,3.0\n")
+    provider = CSVDataProvider(str(csv_path))
+
+    data = provider.get_data("price", "utc_timestamp")
+
+    assert_frame_equal(data, provider.get_data(["price"], "utc_timestamp"))
+    assert list(data.columns) == ["price"]
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
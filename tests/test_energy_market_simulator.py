@@ -2,13 +2,19 @@ import os
 import sys
 from datetime import date
 
+import numpy as np
 import pandas as pd
 import pytest
 
 sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
 
 from scripts.assets.battery import Battery
-from scripts.market_simulator import EnergyMarketSimulator, PnLCalculator
+from scripts.market_simulator import EnergyMarketSimulator, PnLCalculator, kernels
+from scripts.optimizer import (
+    HighsOptimizationSolver,
+    PyomoModelExtractor,
+    PyomoOptimizationModelBuilder,
+)
 from scripts.optimizer.scheduler import BatteryOptimizationScheduler
 from scripts.prices.interfaces import IPriceData
 
@@ -44,6 +50,56 @@ def test_pnl_calculator(battery, schedule_df, actual_prices):
     assert pnl == pytest.approx(expected_pnl)
 
 
+def test_pnl_calculator_charge_takes_precedence(battery):
+    schedule_df = pd.DataFrame({"Charge": [10, 0], "Discharge": [5, 0]})
+    pnl = PnLCalculator(battery).calculate(schedule_df, [5, 10], timestep_hours=0.5)
+
+    assert pnl == pytest.approx(-10 * 5 * 0.5 / 0.9)
+
+
+def test_pnl_calculator_mismatched_lengths(battery, schedule_df, actual_prices):
+    pnl_calculator = PnLCalculator(battery)
+    expected_pnl = -10 * 5 / 0.9 + 15 * 10 * 0.8
+
+    # Only the timesteps that have both a schedule row and a price count
+    short_schedule = pd.DataFrame({"Charge": [10.0, 0.0], "Discharge": [0.0, 15.0]})
+    longer_prices = actual_prices + [25, 30, 35, 40]
+    assert pnl_calculator.calculate(short_schedule, longer_prices) == pytest.approx(
+        expected_pnl
+    )
+    assert pnl_calculator.calculate(schedule_df, actual_prices[:2]) == pytest.approx(
+        expected_pnl
+    )
+
+
+def test_pnl_calculator_nan_price(battery, schedule_df):
+    pnl = PnLCalculator(battery).calculate(schedule_df, [5, float("nan"), 15, 20])
+
+    assert np.isnan(pnl)
+
+
+def test_daily_pnl_matches_masked_formula(battery):
+    rng = np.random.default_rng(0)
+    charge = np.where(rng.random(24) < 0.5, rng.random(24), 0.0)
+    discharge = rng.random(24)
+    price = rng.normal(50.0, 10.0, 24)
+
+    pnl = kernels.daily_pnl(
+        charge,
+        discharge,
+        price,
+        battery.charge_efficiency,
+        battery.discharge_efficiency,
+    )
+
+    charged = np.where(charge > 0, charge, 0.0)
+    discharged = np.where((discharge > 0) & (charge <= 0), discharge, 0.0)
+    assert pnl == pytest.approx(
+        discharged @ price * battery.discharge_efficiency
+        - charged @ price / battery.charge_efficiency
+    )
+
+
 class MockPriceModel(IPriceData):
     def get_prices(self, date):
         return [10, 20, 30, 40], [11, 21, 31, 41]
@@ -124,5 +180,107 @@ def test_energy_market_simulator_single_day(
     assert daily_pnl == pytest.approx(expected_pnl)
 
 
+def test_energy_market_simulator_parallel(
+    battery, pnl_calculator, price_model, scheduler
+):
+    kwargs = dict(
+        start_date=date(2022, 1, 1),
+        end_date=date(2022, 1, 5),
+        price_model=price_model,
+        pnl_calculator=pnl_calculator,
+        scheduler=scheduler,
+    )
+    sequential_battery = Battery(capacity_mwh=100, initial_soc=0.5)
+    parallel_battery = Battery(capacity_mwh=100, initial_soc=0.5)
+
+    sequential = EnergyMarketSimulator(battery=sequential_battery, **kwargs).simulate()
+    parallel = EnergyMarketSimulator(
+        battery=parallel_battery, n_jobs=2, **kwargs
+    ).simulate()
+
+    assert [day for day, _, _ in parallel] == [day for day, _, _ in sequential]
+    for (_, expected_df, expected_pnl), (_, schedule_df, daily_pnl) in zip(
+        sequential, parallel
+    ):
+        pd.testing.assert_frame_equal(schedule_df, expected_df)
+        assert daily_pnl == pytest.approx(expected_pnl)
+    assert parallel_battery.soc == pytest.approx(sequential_battery.soc)
+
+
+class EfficiencyScheduler(MockScheduler):
+    def create_schedule(self, prices):
+        # Charges more the more efficient the battery is when the day is planned
+        charge = 10 * self.battery.charge_efficiency
+        return pd.DataFrame({"Charge": [charge, 0, 0, 0], "Discharge": [0, 5, 0, 0]})
+
+
+@pytest.mark.parametrize("temperature_c", [25, 35])
+def test_energy_market_simulator_parallel_matches_sequential(
+    price_model, temperature_c
+):
+    def simulate(n_jobs):
+        battery = Battery(capacity_mwh=100, temperature_c=temperature_c)
+        simulator = EnergyMarketSimulator(
+            start_date=date(2022, 1, 1),
+            end_date=date(2022, 1, 4),
+            battery=battery,
+            price_model=price_model,
+            pnl_calculator=PnLCalculator(battery),
+            scheduler=EfficiencyScheduler(battery),
+            n_jobs=n_jobs,
+        )
+        return simulator.can_plan_ahead(), simulator.simulate()
+
+    can_plan_ahead, sequential = simulate(n_jobs=1)
+    _, parallel = simulate(n_jobs=2)
+
+    # Away from 25C the efficiencies drop as days are applied, so the days are
+    # planned one by one whatever n_jobs is
+    assert can_plan_ahead == (temperature_c == 25)
+    for (_, expected_df, expected_pnl), (_, schedule_df, daily_pnl) in zip(
+        sequential, parallel
+    ):
+        pd.testing.assert_frame_equal(schedule_df, expected_df)
+        assert daily_pnl == expected_pnl
+
+
+@pytest.mark.skipif(
+    not HighsOptimizationSolver.available(), reason="highspy is not installed"
+)
+def test_energy_market_simulator_pnl_uses_efficiencies_after_the_day(price_model):
+    # Away from 25C every charge and discharge lowers the efficiencies, so the
+    # ones the day was planned with differ from those after it was applied
+    battery = Battery(capacity_mwh=100, initial_soc=0.5, temperature_c=35)
+    scheduler = BatteryOptimizationScheduler(
+        battery,
+        PyomoOptimizationModelBuilder(),
+        HighsOptimizationSolver(),
+        PyomoModelExtractor(),
+    )
+    simulator = EnergyMarketSimulator(
+        start_date=date(2022, 1, 1),
+        end_date=date(2022, 1, 1),
+        battery=battery,
+        price_model=price_model,
+        pnl_calculator=PnLCalculator(battery),
+        scheduler=scheduler,
+    )
+
+    _, schedule_df, daily_pnl = simulator.simulate()[0]
+
+    assert battery.charge_efficiency < 0.9
+    price = np.array([11, 21, 31, 41], dtype=np.float64)
+    charge = schedule_df["Charge"].to_numpy()
+    discharge = schedule_df["Discharge"].to_numpy()
+    charged = np.where(charge > 0, charge, 0.0)
+    discharged = np.where((discharge > 0) & (charge <= 0), discharge, 0.0)
+    expected_pnl = (
+        discharged @ price * battery.discharge_efficiency
+        - charged @ price / battery.charge_efficiency
+    )
+    assert charged.any() or discharged.any()
+    assert daily_pnl == pytest.approx(expected_pnl)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
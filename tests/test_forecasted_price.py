@@ -1,6 +1,7 @@
 import datetime
 import os
 import sys
+from unittest.mock import Mock
 
 import numpy as np
 import pandas as pd
@@ -58,6 +59,68 @@ def test_get_prices():
     assert len(prices_current_date) == 24
 
 
+def test_get_prices_is_cached_until_retrained():
+    data_provider = MockDataProvider()
+    forecast_model = ForecastPriceModel(
+        data_provider=data_provider,
+        feature_engineer=FeatureEngineer(window_size=24, lag=24, lead=24),
+        model=XGBModel(),
+        history_length=24,
+        forecast_length=24,
+        prior_days=1,
+    )
+    full_data = data_provider.get_data("GB_GBN_price_day_ahead", "utc_timestamp")
+    train_data = full_data.loc[full_data.index.day < 4]
+    forecast_model.train(train_data)
+    forecast_model.forecast = Mock(wraps=forecast_model.forecast)
+
+    date = datetime.date(2022, 1, 4)
+    first = forecast_model.get_prices(date)
+    first[0].append(0.0)
+    second = forecast_model.get_prices(date)
+    assert forecast_model.forecast.call_count == 1
+    assert len(second[0]) == 24
+
+    forecast_model.train(train_data)
+    forecast_model.get_prices(date)
+    assert forecast_model.forecast.call_count == 2
+
+
+def test_get_prices_batch_matches_get_prices():
+    data_provider = MockDataProvider()
+    forecast_model = ForecastPriceModel(
+        data_provider=data_provider,
+        feature_engineer=FeatureEngineer(window_size=24, lag=24, lead=24),
+        model=XGBModel(),
+        history_length=24,
+        forecast_length=24,
+        prior_days=1,
+    )
+    full_data = data_provider.get_data("GB_GBN_price_day_ahead", "utc_timestamp")
+    forecast_model.train(full_data.loc[full_data.index.day < 4])
+
+    dates = [datetime.date(2022, 1, day) for day in (4, 2, 3, 4)]
+    batch = forecast_model.get_prices_batch(dates)
+
+    forecast_model._prices_cache.clear()
+    assert batch == [forecast_model.get_prices(date) for date in dates]
+
+
+def test_window_days_keeps_the_last_days():
+    forecast_model = ForecastPriceModel(
+        data_provider=MockDataProvider(),
+        feature_engineer=FeatureEngineer(window_size=24, lag=24, lead=24),
+        model=XGBModel(),
+        history_length=24,
+        forecast_length=24,
+        prior_days=1,
+        window_days=1,
+    )
+
+    assert forecast_model.data.index[0] == pd.Timestamp("2022-01-03", tz="UTC")
+    assert forecast_model.data["GB_GBN_price_day_ahead"].tolist() == list(range(48, 96))
+
+
 def test_train():
     # Create a mock data provider, feature engineer, and model
     data_provider = MockDataProvider()
@@ -2,11 +2,24 @@ import os
 import sys
 from datetime import datetime
 
+import numpy as np
+import pandas as pd
 import pytest
 
 sys.path.append(os.path.realpath(os.path.dirname(__file__) + "/.."))
-from scripts.prices import HistoricalAveragePriceModel
+from scripts.prices import HistoricalAveragePriceModel, PriceDataHelper
 from scripts.shared import CSVDataProvider
+from scripts.shared.interfaces import IDataProvider
+
+
+class GapDataProvider(IDataProvider):
+    def get_data(self, column_names, timestamp_column):
+        prices = np.arange(48, dtype=float)
+        prices[[10, 11, 30]] = np.nan
+        return pd.DataFrame(
+            {"GB_GBN_price_day_ahead": prices},
+            index=pd.date_range("2022-01-01", periods=48, freq="h", tz="UTC"),
+        )
 
 
 @pytest.mark.parametrize("create_test_csv", ["GB_GBN_price_day_ahead"], indirect=True)
@@ -22,5 +35,65 @@ def test_historical_average_price_model(create_test_csv):
     assert prices_current_date is not None
 
 
+@pytest.mark.parametrize("create_test_csv", ["GB_GBN_price_day_ahead"], indirect=True)
+def test_historical_average_price_model_values(create_test_csv):
+    csv_path = os.path.join("tests", "test.csv")
+    model = HistoricalAveragePriceModel(data_provider=CSVDataProvider(csv_path))
+
+    average_prices_last_week, prices_current_date = model.get_prices(
+        datetime(2022, 1, 7)
+    )
+
+    # The test prices count the hours from 2021-12-31, so the hour h of the
+    # seven prior days averages to h + 72 and of the current day is 168 + h
+    assert average_prices_last_week == [hour + 72.0 for hour in range(24)]
+    assert prices_current_date == [hour + 168.0 for hour in range(24)]
+
+
+@pytest.mark.parametrize("create_test_csv", ["GB_GBN_price_day_ahead"], indirect=True)
+def test_historical_average_price_model_partial_week(create_test_csv):
+    csv_path = os.path.join("tests", "test.csv")
+    model = HistoricalAveragePriceModel(data_provider=CSVDataProvider(csv_path))
+
+    assert model.get_prices(datetime(2021, 12, 31)) == ([], list(map(float, range(24))))
+    assert model.get_prices(datetime(2022, 1, 1))[0] == list(map(float, range(24)))
+    assert model.get_prices(datetime(2022, 2, 1)) == ([], [])
+
+
+def test_historical_average_price_model_interpolates_missing_prices():
+    model = HistoricalAveragePriceModel(data_provider=GapDataProvider())
+
+    average_prices_last_week, prices_current_date = model.get_prices(
+        datetime(2022, 1, 2)
+    )
+
+    assert average_prices_last_week == list(map(float, range(24)))
+    assert prices_current_date == list(map(float, range(24, 48)))
+
+
+def test_price_data_helper_interpolate_matches_pandas():
+    prices = pd.Series(
+        [np.nan, 1.0, np.nan, np.nan, 4.0, np.nan, 10.0, np.nan, np.nan],
+        index=pd.date_range("2022-01-01", periods=9, freq="h", tz="UTC"),
+        name="GB_GBN_price_day_ahead",
+    )
+
+    pd.testing.assert_series_equal(
+        PriceDataHelper().interpolate(prices), prices.interpolate(method="linear")
+    )
+
+
+def test_price_data_helper_prices_current_date_are_floats():
+    data = pd.DataFrame(
+        {"GB_GBN_price_day_ahead": np.arange(3, dtype=np.float32)},
+        index=pd.date_range("2022-01-01", periods=3, freq="h", tz="UTC"),
+    )
+
+    prices = PriceDataHelper().get_prices_current_date(data, "GB_GBN_price_day_ahead")
+
+    assert prices == [0.0, 1.0, 2.0]
+    assert all(type(price) is float for price in prices)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
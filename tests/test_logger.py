@@ -38,5 +38,22 @@ def test_logger(logger):
     assert "critical" in logs[4]
 
 
+def test_logger_formats_args(logger):
+    logger, log_output = logger
+    logger.info("%s: %d", "count", 3)
+
+    log_output.seek(0)
+    assert "count: 3" in log_output.read()
+
+
+def test_logger_skips_formatting_below_level():
+    class Unformattable:
+        def __str__(self):
+            raise AssertionError("should not be formatted")
+
+    logger = Logger(level=logging.INFO)
+    logger.debug("%s", Unformattable())
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
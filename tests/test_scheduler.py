@@ -11,6 +11,7 @@ from scripts.assets.battery import Battery  # noqa: E402
 from scripts.optimizer import (
     BatteryOptimizationScheduler,
     GLPKOptimizationSolver,
+    HighsOptimizationSolver,
     PyomoModelExtractor,
     PyomoOptimizationModelBuilder,
 )
@@ -80,6 +81,23 @@ def test_define_objective_function():
     assert isinstance(model.objective, pyo.Objective)
 
 
+def test_objective_function_value():
+    builder = PyomoOptimizationModelBuilder()
+    battery = Battery(capacity_mwh=1.0, charge_efficiency=0.8, discharge_efficiency=0.9)
+    prices = [10.0, 20.0, 30.0]
+    model = builder.build_model(3, prices, battery, 0.5, 5.0)
+    for t, (charge, discharge) in enumerate([(0.4, 0.0), (0.0, 0.2), (0.1, 0.3)]):
+        model.charge_vars[t].set_value(charge)
+        model.discharge_vars[t].set_value(discharge)
+
+    expected = sum(
+        model.discharge_vars[t].value * prices[t] * 0.9 / 0.5
+        - model.charge_vars[t].value * prices[t] / (0.8 * 0.5)
+        for t in range(3)
+    )
+    assert pyo.value(model.objective) == pytest.approx(expected)
+
+
 def test_define_constraints():
     # Arrange
     builder = PyomoOptimizationModelBuilder()
@@ -285,7 +303,9 @@ def test_create_schedule():
     result.solver.termination_condition = pyo.TerminationCondition.optimal
     solver.solve.return_value = result
 
-    expected_schedule = mock.Mock()
+    expected_schedule = pd.DataFrame(
+        {"Charge": [0.9, 0.0, 0.0], "Discharge": [0.0, 0.5, 0.0]}
+    )
     model_extractor.extract_schedule.return_value = expected_schedule
 
     # Act
@@ -295,7 +315,89 @@ def test_create_schedule():
     model_builder.build_model.assert_called_once()
     solver.solve.assert_called_once_with(model, False)
     model_extractor.extract_schedule.assert_called_once_with(model, len(prices))
-    assert schedule == expected_schedule
+    assert schedule is expected_schedule
+
+
+def test_update_prices():
+    builder = PyomoOptimizationModelBuilder()
+    battery = Battery(capacity_mwh=1.0, initial_soc=0.5)
+    model = builder.build_model(3, [10.0, 20.0, 30.0], battery, 1.0, 5.0)
+
+    assert builder.update_prices(model, [40.0, 50.0, 60.0])
+
+    assert [pyo.value(model.price[t]) for t in model.T] == [40.0, 50.0, 60.0]
+
+
+def test_create_schedule_reuses_model():
+    battery = Battery(capacity_mwh=1.0, initial_soc=0.5)
+    model_builder = mock.Mock()
+    solver = mock.Mock()
+    model_extractor = mock.Mock()
+    model_extractor.extract_schedule.side_effect = lambda model, n: pd.DataFrame(
+        {"Charge": [0.0] * n, "Discharge": [0.0] * n}
+    )
+    scheduler = BatteryOptimizationScheduler(
+        battery, model_builder, solver, model_extractor
+    )
+    model = mock.Mock()
+    model_builder.build_model.return_value = model
+    model_builder.update_prices.return_value = True
+    result = mock.Mock()
+    result.solver.status = pyo.SolverStatus.ok
+    result.solver.termination_condition = pyo.TerminationCondition.optimal
+    solver.solve.return_value = result
+
+    scheduler.create_schedule([10.0] * 10)
+    scheduler.create_schedule([20.0] * 10)
+    scheduler.create_schedule([30.0] * 5)
+
+    # The second day only updates the prices; a new horizon needs a new model
+    assert model_builder.build_model.call_count == 2
+    model_builder.update_prices.assert_called_once_with(model, [20.0] * 10)
+
+
+@pytest.mark.skipif(
+    not HighsOptimizationSolver.available(), reason="highspy is not installed"
+)
+@pytest.mark.parametrize("params_only", [False, True])
+def test_highs_solver_reused_model_matches_fresh_model(params_only):
+    battery = Battery(capacity_mwh=1.0, initial_soc=0.5)
+    prices = [[30.0, 10.0, 50.0, 20.0, 60.0], [60.0, 20.0, 10.0, 50.0, 30.0]]
+
+    def scheduler(params_only=False):
+        return BatteryOptimizationScheduler(
+            battery,
+            PyomoOptimizationModelBuilder(),
+            HighsOptimizationSolver(params_only=params_only),
+            PyomoModelExtractor(),
+        )
+
+    reused = scheduler(params_only)
+    schedules = [reused.create_schedule(day_prices) for day_prices in prices]
+
+    for day_prices, schedule in zip(prices, schedules):
+        pd.testing.assert_frame_equal(
+            schedule, scheduler().create_schedule(day_prices), atol=1e-9
+        )
+    assert not schedules[0].equals(schedules[1])
+
+
+@pytest.mark.skipif(
+    not HighsOptimizationSolver.available(), reason="highspy is not installed"
+)
+def test_highs_solver_reports_infeasible():
+    model = pyo.ConcreteModel()
+    model.x = pyo.Var(bounds=(0, 1))
+    model.objective = pyo.Objective(expr=model.x, sense=pyo.maximize)
+    model.constraint = pyo.Constraint(expr=model.x >= 2)
+
+    with mock.patch.object(Logger, "warning") as mock_warning:
+        result = HighsOptimizationSolver().solve(model)
+
+    assert result.solver.termination_condition == pyo.TerminationCondition.infeasible
+    mock_warning.assert_called_once_with(
+        "Solution is infeasible. Review model constraints."
+    )
 
 
 def test_create_schedule_raises_exception_on_failed_optimization():
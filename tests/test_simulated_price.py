@@ -1,7 +1,7 @@
 import os
 import sys
 from datetime import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 import pytest
 
@@ -20,6 +20,16 @@ def test_simulated_price_envelope_generator():
     assert len(prices) == 24
 
 
+def test_simulated_price_envelope_generator_is_seeded_by_date():
+    generator = SimulatedPriceEnvelopeGenerator(min_price=10.0, max_price=100.0)
+    prices = generator.generate(datetime(2022, 1, 1))
+
+    assert prices == generator.generate(datetime(2022, 1, 1))
+    assert prices != generator.generate(datetime(2022, 1, 2))
+    assert all(isinstance(price, float) for price in prices)
+    assert min(prices) >= 10.0 and max(prices) <= 100.0
+
+
 def test_simulated_price_noise_adder():
     adder = SimulatedPriceNoiseAdder()
     prices = [10, 20, 30, 40, 50]
@@ -27,6 +37,26 @@ def test_simulated_price_noise_adder():
     assert len(prices_with_noise) == len(prices)
 
 
+def test_simulated_price_noise_adder_without_spikes():
+    adder = SimulatedPriceNoiseAdder(noise_level=5.0, spike_chance=0.0)
+    prices = [1.0, 20.0, 30.0]
+    prices_with_noise = adder.add(prices)
+
+    assert all(isinstance(price, float) for price in prices_with_noise)
+    assert prices_with_noise[0] >= 0.0
+    assert 15.0 <= prices_with_noise[1] <= 25.0
+    assert 25.0 <= prices_with_noise[2] <= 35.0
+
+
+def test_simulated_price_noise_adder_seed():
+    prices = [10.0, 20.0, 30.0, 40.0, 50.0]
+
+    first = SimulatedPriceNoiseAdder(seed=1).add(prices)
+    second = SimulatedPriceNoiseAdder(seed=1).add(prices)
+
+    assert first == second
+
+
 def test_simulated_price_model():
     mock_envelope_generator = Mock(spec=SimulatedPriceEnvelopeGenerator)
     mock_envelope_generator.generate.return_value = [10, 20, 30, 40, 50]
@@ -53,14 +83,11 @@ def test_add_increases_price_when_random_less_than_spike_chance():
     )
     prices = [10.0]
 
-    with patch("random.random", return_value=0.01), patch(
-        "random.uniform", return_value=0.0
-    ):
-        # Act
-        noisy_prices = noise_adder.add(prices)
+    # Act
+    noisy_prices = noise_adder.add(prices)
 
-        # Assert
-        assert noisy_prices[0] == 15.0  # 10.0 * 1.5
+    # Assert
+    assert noisy_prices[0] == 15.0  # 10.0 * 1.5
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 import os
+import pickle
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 import pandas as pd
@@ -15,8 +17,13 @@ from scripts.forecast import (
     DataPreprocessor,
     FeatureEngineer,
     IModel,
+    ProgressMultiOutputRegressor,
     TimeSeriesForecaster,
     XGBModel,
+    rolling_moments,
+    rolling_quantile_block,
+    rolling_quantiles,
+    rolling_skew,
 )
 
 
@@ -178,6 +185,175 @@ def test_transform():
     np.testing.assert_array_equal(transformed_df.values, expected_values)
 
 
+def test_rolling_quantiles_matches_pandas():
+    values = np.random.default_rng(42).normal(size=200)
+    values[50] = np.nan
+
+    q25, q75 = rolling_quantiles(values, 24, 0.25, 0.75)
+
+    series = pd.Series(values)
+    np.testing.assert_allclose(
+        q25, series.rolling(window=24).quantile(0.25).to_numpy(), equal_nan=True
+    )
+    np.testing.assert_allclose(
+        q75, series.rolling(window=24).quantile(0.75).to_numpy(), equal_nan=True
+    )
+
+
+def test_rolling_quantile_block_median_matches_pandas():
+    values = np.random.default_rng(42).normal(size=200)
+    values[50] = np.nan
+
+    block = rolling_quantile_block(values, 24, np.array([0.5, 0.25]))
+
+    series = pd.Series(values)
+    np.testing.assert_allclose(
+        block[:, 0], series.rolling(window=24).median().to_numpy(), equal_nan=True
+    )
+    np.testing.assert_allclose(
+        block[:, 1], series.rolling(window=24).quantile(0.25).to_numpy(), equal_nan=True
+    )
+
+
+def test_rolling_moments_matches_pandas():
+    values = np.random.default_rng(42).normal(loc=100, scale=30, size=500)
+    values[50] = np.nan
+    values[200:240] = 42.0
+
+    rolling = pd.Series(values).rolling(window=24)
+    expected = [rolling.mean(), rolling.min(), rolling.max(), rolling.std()]
+
+    for result, expected_result in zip(rolling_moments(values, 24), expected):
+        np.testing.assert_allclose(
+            result, expected_result.to_numpy(), rtol=1e-9, atol=1e-9, equal_nan=True
+        )
+
+
+def test_rolling_skew_matches_pandas():
+    values = np.random.default_rng(42).normal(loc=100, scale=30, size=500)
+    values[50] = np.nan
+    values[200:240] = 42.0
+
+    expected = pd.Series(values).rolling(window=24).skew().to_numpy()
+
+    np.testing.assert_allclose(
+        rolling_skew(values, 24), expected, rtol=1e-9, atol=1e-9, equal_nan=True
+    )
+
+
+def test_transform_to_arrays_cache_dir(tmp_path):
+    df = pd.DataFrame(
+        {"value": np.arange(48, dtype=float)},
+        index=pd.date_range("2022-01-01", periods=48, freq="h"),
+    )
+    feature_engineer = FeatureEngineer(
+        window_size=3, lag=3, lead=2, cache_dir=str(tmp_path)
+    )
+
+    expected_X, expected_y = feature_engineer.transform_to_arrays(df)
+    assert len(list(tmp_path.glob("feats_*.npz"))) == 1
+
+    cached_X, cached_y = feature_engineer.transform_to_arrays(df)
+    np.testing.assert_array_equal(cached_X, expected_X)
+    np.testing.assert_array_equal(cached_y, expected_y)
+
+    # Changed data or settings must not be served from the cache
+    feature_engineer.transform_to_arrays(df, include_lead=False)
+    df.iloc[-1, 0] = -1.0
+    feature_engineer.transform_to_arrays(df)
+    assert len(list(tmp_path.glob("feats_*.npz"))) == 3
+
+
+def test_transform_to_arrays_cache_version(tmp_path, monkeypatch):
+    df = pd.DataFrame(
+        {"value": np.arange(48, dtype=float)},
+        index=pd.date_range("2022-01-01", periods=48, freq="h"),
+    )
+    feature_engineer = FeatureEngineer(
+        window_size=3, lag=3, lead=2, cache_dir=str(tmp_path)
+    )
+    feature_engineer.transform_to_arrays(df)
+
+    # Arrays cached by older feature code must not be served
+    monkeypatch.setattr("scripts.forecast.ts_forecast._FEATURE_CACHE_VERSION", -1)
+    feature_engineer.transform_to_arrays(df)
+    assert len(list(tmp_path.glob("feats_*.npz"))) == 2
+
+
+def test_transform_to_arrays_cache_concurrent_writers(tmp_path):
+    df = pd.DataFrame(
+        {"value": np.arange(48, dtype=float)},
+        index=pd.date_range("2022-01-01", periods=48, freq="h"),
+    )
+    expected_X, expected_y = FeatureEngineer(
+        window_size=3, lag=3, lead=2
+    ).transform_to_arrays(df)
+
+    def transform(_):
+        feature_engineer = FeatureEngineer(
+            window_size=3, lag=3, lead=2, cache_dir=str(tmp_path)
+        )
+        return feature_engineer.transform_to_arrays(df)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(transform, range(16)))
+
+    for X, y in results:
+        np.testing.assert_array_equal(X, expected_X)
+        np.testing.assert_array_equal(y, expected_y)
+    assert [path.suffix for path in tmp_path.iterdir()] == [".npz"]
+
+
+def test_train_reads_features_from_cache(tmp_path, monkeypatch):
+    df = pd.DataFrame(
+        {"value": np.arange(48, dtype=float)},
+        index=pd.date_range("2022-01-01", periods=48, freq="h"),
+    )
+    feature_engineer = FeatureEngineer(
+        window_size=3, lag=3, lead=2, cache_dir=str(tmp_path)
+    )
+    data_preprocessor = DataPreprocessor(
+        feature_engineer=feature_engineer, history_length=3, forecast_length=2
+    )
+    forecaster = TimeSeriesForecaster(XGBModel(), data_preprocessor)
+
+    forecaster.train(df, column_name="value")
+    validation_mse = forecaster.validation_mse
+
+    # The second call must not build the features again
+    def fail(*args, **kwargs):
+        raise AssertionError("features were rebuilt")
+
+    monkeypatch.setattr(feature_engineer, "_build_arrays", fail)
+    forecaster.train(df, column_name="value")
+
+    assert forecaster.validation_mse == validation_mse
+    assert len(list(tmp_path.glob("feats_*.npz"))) == 1
+
+
+def test_transform_to_arrays_incremental_matches_fresh():
+    n = 24 * 10
+    df = pd.DataFrame(
+        {"value": np.random.default_rng(0).normal(100, 30, n)},
+        index=pd.date_range("2022-01-01", periods=n, freq="h"),
+    )
+    incremental = FeatureEngineer(window_size=24, lag=48, lead=24, incremental=True)
+    fresh = FeatureEngineer(window_size=24, lag=48, lead=24)
+
+    for day in range(3, 10):
+        window = df.iloc[(day - 3) * 24 : day * 24]
+        X, y = incremental.transform_to_arrays(window, column_name="value")
+        expected_X, expected_y = fresh.transform_to_arrays(window, column_name="value")
+
+        np.testing.assert_allclose(X, expected_X, rtol=1e-5)
+        np.testing.assert_array_equal(y, expected_y)
+        # The cache slides with the window instead of growing
+        assert incremental._engineered_cache["index"].equals(window.index)
+
+    # Reuse only matches up to rounding, so it has to be asked for
+    assert fresh._engineered_cache is None
+
+
 def test_xgb_model_fit():
     # Generate dummy data
     X, y = make_regression(n_samples=100, n_features=5, n_targets=3, random_state=42)
@@ -206,6 +382,119 @@ def test_xgb_model_predict():
     assert y_pred.shape == (10, 3)
 
 
+def test_xgb_model_cuda_device_params():
+    model = XGBModel({"n_estimators": 10}, device="cuda")
+
+    params = model.model.estimator.get_params()
+    assert params["device"] == "cuda"
+    assert params["tree_method"] == "hist"
+    assert params["n_estimators"] == 10
+
+
+def test_xgb_model_parallel_fit_matches_sequential():
+    X, y = make_regression(n_samples=100, n_features=5, n_targets=3, random_state=42)
+    params = {"n_estimators": 10, "max_depth": 3, "random_state": 42}
+
+    sequential = XGBModel(params)
+    sequential.fit(X, y)
+    parallel = XGBModel(params, n_jobs=2)
+    parallel.fit(X, y)
+
+    assert len(parallel.model.estimators_) == 3
+    assert parallel.model.estimators_[0].get_params()["n_jobs"] >= 1
+    np.testing.assert_allclose(parallel.predict(X), sequential.predict(X), rtol=1e-5)
+
+
+def test_shared_sketch_fit_matches_per_output_fit():
+    X, y = make_regression(n_samples=200, n_features=5, n_targets=3, random_state=42)
+    X_train, X_val, y_train, y_val = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+    estimator = XGBRegressor(n_estimators=50, max_depth=3, random_state=42)
+
+    model = ProgressMultiOutputRegressor(estimator)
+    model.fit(X_train, y_train, eval_set=[(X_val, y_val)], early_stopping_rounds=5)
+
+    for i, fitted in enumerate(model.estimators_):
+        expected = XGBRegressor(**estimator.get_params()).fit(
+            X_train,
+            y_train[:, i],
+            eval_set=[(X_val, y_val[:, i])],
+            early_stopping_rounds=5,
+            verbose=False,
+        )
+        assert fitted.best_iteration == expected.best_iteration
+        np.testing.assert_array_equal(fitted.predict(X_val), expected.predict(X_val))
+
+
+def test_xgb_model_multi_output_tree():
+    X, y = make_regression(n_samples=100, n_features=5, n_targets=3, random_state=42)
+    X_train, X_val, y_train, y_val = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+
+    model = XGBModel({"n_estimators": 10, "max_depth": 3}, multi_output_tree=True)
+    model.fit(X_train, y_train, eval_set=[(X_val, y_val)], early_stopping_rounds=5)
+
+    assert isinstance(model.model, XGBRegressor)
+    assert model.model.get_params()["multi_strategy"] == "multi_output_tree"
+    y_pred = model.predict(X_val)
+    assert y_pred.shape == y_val.shape
+    np.testing.assert_allclose(
+        y_pred, model.predict(X_val, fast_predict=False), rtol=1e-6
+    )
+
+
+def test_xgb_model_chain_fit_predict():
+    X, y = make_regression(n_samples=100, n_features=5, n_targets=3, random_state=42)
+    X_train, X_val, y_train, y_val = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+
+    model = XGBModel({"n_estimators": 10, "max_depth": 3}, use_chain=True)
+    model.fit(X_train, y_train, eval_set=[(X_val, y_val)], early_stopping_rounds=5)
+    y_pred = model.predict(X_val)
+
+    assert y_pred.shape == y_val.shape
+    assert [e.n_features_in_ for e in model.model.estimators_] == [5, 6, 7]
+    # The last link sees the first two links' predictions as extra features
+    X_chain = np.column_stack([X_val, y_pred[:, :2]]).astype(np.float32)
+    np.testing.assert_allclose(
+        y_pred[:, 2], model.model.estimators_[2].predict(X_chain), rtol=1e-5
+    )
+
+
+def test_xgb_model_fast_predict_matches_predict():
+    X, y = make_regression(n_samples=100, n_features=5, n_targets=3, random_state=42)
+    X_train, X_val, y_train, y_val = train_test_split(
+        X, y, test_size=0.2, random_state=42
+    )
+
+    model = XGBModel({"n_estimators": 20, "max_depth": 3})
+    model.fit(X_train, y_train, eval_set=[(X_val, y_val)], early_stopping_rounds=2)
+
+    np.testing.assert_allclose(
+        model.predict(X_val, fast_predict=True),
+        model.predict(X_val, fast_predict=False),
+        rtol=1e-6,
+    )
+
+
+@pytest.mark.parametrize(
+    "cuda_available, expected_device", [(True, "cuda"), (False, "cpu")]
+)
+def test_xgb_model_auto_device(monkeypatch, cuda_available, expected_device):
+    monkeypatch.setattr(
+        "scripts.forecast.ts_forecast._cuda_available", lambda: cuda_available
+    )
+    model = XGBModel({"n_estimators": 10}, device="auto")
+
+    assert model.device == expected_device
+    assert model.model.estimator.get_params()["device"] == (
+        "cuda" if cuda_available else None
+    )
+
+
 def test_xgb_model_fit_predict_consistency():
     # Generate dummy data
     X, y = make_regression(n_samples=100, n_features=5, n_targets=3, random_state=42)
@@ -350,7 +639,9 @@ def test_preprocess_data():
     expected_y = np.array(
         [[4.0, 5.0], [5.0, 6.0], [6.0, 7.0], [7.0, 8.0], [8.0, 9.0], [9.0, 10.0]]
     )
-    np.testing.assert_array_equal(X, expected_X)
+    assert X.dtype == np.float32
+    assert X.flags["F_CONTIGUOUS"]
+    np.testing.assert_allclose(X, expected_X, rtol=1e-6)
     np.testing.assert_array_equal(y, expected_y)
 
 
@@ -422,6 +713,37 @@ def test_forecast():
     assert forecast.shape == (1, 2)
 
 
+def test_forecast_reads_features_from_cache(tmp_path, monkeypatch):
+    df = pd.DataFrame(
+        {"value": np.arange(48, dtype=float)},
+        index=pd.date_range("2022-01-01", periods=48, freq="h"),
+    )
+    feature_engineer = FeatureEngineer(window_size=3, lag=3, lead=2)
+    data_preprocessor = DataPreprocessor(
+        feature_engineer=feature_engineer, history_length=3, forecast_length=2
+    )
+    forecaster = TimeSeriesForecaster(XGBModel(), data_preprocessor)
+    forecaster.train(df, column_name="value")
+    expected = forecaster.forecast(df, column_name="value")
+
+    feature_engineer.cache_dir = str(tmp_path)
+    np.testing.assert_array_equal(
+        forecaster.forecast(df, column_name="value"), expected
+    )
+
+    def fail(*args, **kwargs):
+        raise AssertionError("features were rebuilt")
+
+    monkeypatch.setattr(feature_engineer, "_build_arrays", fail)
+    np.testing.assert_array_equal(
+        forecaster.forecast(df, column_name="value"), expected
+    )
+    np.testing.assert_array_equal(
+        forecaster.forecast_many([df], column_name="value")[0], expected
+    )
+    assert len(list(tmp_path.glob("feats_*.npz"))) == 1
+
+
 def test_evaluate():
     # Create dummy true and predicted values
     y_true = np.array([[1, 2], [3, 4], [5, 6]])
@@ -476,5 +798,92 @@ def test_load_model(tmp_path):
     assert isinstance(loaded_forecaster, IModel)
 
 
+@pytest.mark.parametrize("multi_output_tree", [False, True])
+def test_save_load_native_model_roundtrip(tmp_path, multi_output_tree):
+    X, y = make_regression(n_samples=100, n_features=5, n_targets=3, random_state=42)
+    model = XGBModel(
+        {"n_estimators": 10, "max_depth": 3}, multi_output_tree=multi_output_tree
+    )
+    model.fit(X, y)
+    forecaster = TimeSeriesForecaster(model, DataPreprocessor(FeatureEngineer()))
+
+    file_path = tmp_path / "model.json"
+    forecaster.save_model(file_path)
+    loaded_model = TimeSeriesForecaster.load_model(file_path)
+
+    expected_boosters = 1 if multi_output_tree else 3
+    assert len(list(tmp_path.glob("model_*.ubj"))) == expected_boosters
+    np.testing.assert_allclose(loaded_model.predict(X), model.predict(X), rtol=1e-6)
+    # Cached loads still give every caller its own model
+    reloaded_model = TimeSeriesForecaster.load_model(file_path)
+    assert reloaded_model is not loaded_model
+    np.testing.assert_array_equal(reloaded_model.predict(X), loaded_model.predict(X))
+
+
+def test_save_model_pickles_pkl_path(tmp_path):
+    X, y = make_regression(n_samples=50, n_features=5, n_targets=2, random_state=42)
+    model = XGBModel({"n_estimators": 5})
+    model.fit(X, y)
+    forecaster = TimeSeriesForecaster(model, DataPreprocessor(FeatureEngineer()))
+
+    file_path = tmp_path / "model.pkl"
+    forecaster.save_model(file_path)
+
+    with open(file_path, "rb") as f:
+        unpickled_model = pickle.load(f)
+    np.testing.assert_allclose(unpickled_model.predict(X), model.predict(X))
+    assert not list(tmp_path.glob("*.ubj"))
+
+
+def test_load_model_returns_copy(tmp_path):
+    forecaster = TimeSeriesForecaster(XGBModel(), DataPreprocessor(FeatureEngineer()))
+    file_path = tmp_path / "model.pkl"
+    forecaster.save_model(file_path)
+
+    loaded_model = TimeSeriesForecaster.load_model(file_path)
+    loaded_model.config["n_estimators"] = 1
+
+    assert TimeSeriesForecaster.load_model(file_path).config != loaded_model.config
+
+
+def test_load_model_rejects_unknown_json(tmp_path):
+    file_path = tmp_path / "model.json"
+    file_path.write_text('{"format": "something-else"}')
+
+    with pytest.raises(ValueError, match="save_native"):
+        TimeSeriesForecaster.load_model(file_path)
+
+
+def test_load_model_legacy_pickle(tmp_path):
+    X, y = make_regression(n_samples=50, n_features=5, n_targets=2, random_state=42)
+    model = XGBModel({"n_estimators": 5})
+    model.fit(X, y)
+
+    file_path = tmp_path / "legacy.pkl"
+    with open(file_path, "wb") as f:
+        pickle.dump(model, f)
+
+    loaded_model = TimeSeriesForecaster.load_model(file_path)
+    np.testing.assert_allclose(loaded_model.predict(X), model.predict(X))
+
+
+def test_load_model_baseline_pickle(tmp_path):
+    X, y = make_regression(n_samples=50, n_features=5, n_targets=2, random_state=42)
+    model = XGBModel({"n_estimators": 5})
+    model.fit(X, y)
+    # Pickles from before the device and multi-output options only hold `model`
+    baseline_model = object.__new__(XGBModel)
+    baseline_model.__dict__["model"] = model.model
+
+    file_path = tmp_path / "baseline.pkl"
+    with open(file_path, "wb") as f:
+        pickle.dump(baseline_model, f)
+
+    loaded_model = TimeSeriesForecaster.load_model(file_path)
+    np.testing.assert_allclose(loaded_model.predict(X), model.predict(X))
+    assert not loaded_model.multi_output_tree
+    assert loaded_model.config["params"]["n_estimators"] == 5
+
+
 if __name__ == "__main__":
     pytest.main([__file__])